@@ -8,6 +8,36 @@ and unclosed string structures in JSON data.
 import re
 from re import Match
 
+# Inputs without any of these have nothing for handle_sparse_arrays to fix
+_SPARSE_ARRAY_TRIGGER_RE = re.compile(r",,|, ,|\[\s*,")
+_SIMPLE_ARRAY_RE = re.compile(r"\[([^\[\]]*)\]")
+_LEADING_SPARSE_RE = re.compile(r"^\s*,")
+_CONSECUTIVE_COMMAS_RE = re.compile(r",{2,}")
+
+
+def _has_double_comma(text: str) -> bool:
+    """Check for ",," or ", ," with plain substring searches."""
+    return ",," in text or ", ," in text
+
+
+def _fill_sparse_commas(match: Match[str]) -> str:
+    """Replace n consecutive commas with the (n-1) nulls they imply."""
+    null_count = len(match.group(0)) - 1
+    return "," + ",".join(["null"] * null_count) + ","
+
+
+def _fix_simple_sparse_array(match: Match[str]) -> str:
+    """Fill leading and consecutive-comma holes in a flat array."""
+    array_content = match.group(1)
+    leading = _LEADING_SPARSE_RE.match(array_content)
+    if not leading and ",," not in array_content:
+        return match.group(0)
+
+    if leading:
+        array_content = "null," + array_content[leading.end() :]
+    array_content = _CONSECUTIVE_COMMAS_RE.sub(_fill_sparse_commas, array_content)
+    return "[" + array_content + "]"
+
 
 class ArrayObjectHandler:
     """Handles array and object structural processing operations."""
@@ -22,7 +52,6 @@ class ArrayObjectHandler:
         - Set literals: {1, 2, 3} -> [1, 2, 3] for arrays
         - Mixed object/array syntax detection
         """
-
         # Safe implementation - basic parentheses to braces conversion
         if '("' in text and '":' in text:
             # Simple replacement for clear object patterns
@@ -63,85 +92,56 @@ class ArrayObjectHandler:
         Note: Only arrays support sparse elements. Objects with double commas
         are invalid.
         """
+        if not _SPARSE_ARRAY_TRIGGER_RE.search(text):
+            return text
 
         # SIMPLE SAFE IMPLEMENTATION - no complex regex
         # Just handle the most basic cases to avoid infinite loops
 
         # Step 1: Clean obvious object double commas (very conservative)
+        if _has_double_comma(text):
+            lines = text.split("\n")
+            for index, line in enumerate(lines):
+                # Process lines with object structure, but be very careful
+                # about mixed contexts
+                stripped = line.strip()
+                is_pure_object_line = (
+                    stripped.startswith("{")
+                    and stripped.endswith("}")
+                    and "[" not in line
+                    and "]" not in line
+                )
+
+                # Only clean object commas in pure object contexts (no arrays
+                # on same line)
+                if is_pure_object_line and ":" in line and _has_double_comma(line):
+                    # Simple replacement - remove double/spaced commas in
+                    # object contexts
+                    lines[index] = line.replace(",,", ",").replace(", ,", ",")
+            text = "\n".join(lines)
+
+        # Step 2: Handle array sparse elements in flat arrays (including
+        # multiline ones); n consecutive commas = (n-1) missing values
+        text = _SIMPLE_ARRAY_RE.sub(_fix_simple_sparse_array, text)
+
+        # Then handle more complex arrays by finding , , patterns in array
+        # contexts. This will catch nested cases that the regex above missed
+        if not _has_double_comma(text):
+            return text
         lines = text.split("\n")
-        result_lines = []
-
-        for line in lines:
-            # Process lines with object structure, but be very careful about mixed contexts
-            stripped = line.strip()
-            is_pure_object_line = (
-                stripped.startswith("{")
-                and stripped.endswith("}")
-                and "[" not in line
-                and "]" not in line
-            )
-
-            # Only clean object commas in pure object contexts (no arrays on same line)
-            if is_pure_object_line and ":" in line and (",," in line or ", ," in line):
-                # Simple replacement - remove double/spaced commas in object contexts
-                line = line.replace(",,", ",").replace(", ,", ",")
-            result_lines.append(line)
-
-        text = "\n".join(result_lines)
-
-        # Step 2: Handle array sparse elements (more comprehensive)
-        # Use regex to find and fix arrays, including multiline ones
-
-        def fix_array_sparse(match: Match[str]) -> str:
-            array_content = match.group(1)
-
-            # Handle leading commas
-            array_content = re.sub(r"^\s*,", "null,", array_content)
-
-            # Handle consecutive commas properly using regex
-            # n consecutive commas = (n-1) missing values
-            # So ,, -> ,null, and ,,, -> ,null,null,
-
-            def replace_consecutive_commas(match: re.Match[str]) -> str:
-                commas = match.group(0)
-                null_count = len(commas) - 1  # n commas = (n-1) missing values
-                if null_count > 0:
-                    return "," + ",".join(["null"] * null_count) + ","
-
-                return commas  # Single comma, no change
-
-            # Replace sequences of 2 or more consecutive commas
-            array_content = re.sub(r",{2,}", replace_consecutive_commas, array_content)
-
-            return "[" + array_content + "]"
-
-        # Find and fix sparse elements in arrays
-        # First, handle simple arrays (not containing nested brackets)
-        text = re.sub(r"\[([^\[\]]*)\]", fix_array_sparse, text)
-
-        # Then handle more complex arrays by finding , , patterns globally in array contexts
-        # This will catch nested cases that the regex above missed
-        lines = text.split("\n")
-        result_lines = []
-        for line in lines:
+        for index, line in enumerate(lines):
             # If line has arrays, fix sparse patterns (both ,, and , ,)
             if "[" in line and "]" in line:
                 # Replace both ,, and , , with , null, in array contexts
                 for _ in range(10):  # Limit iterations to avoid infinite loops
-                    old_line = line
                     if ", ," in line:
                         line = line.replace(", ,", ", null,", 1)
                     elif ",," in line:
                         line = line.replace(",,", ", null,", 1)
                     else:
                         break
-                    # Safety check - if no change, break
-                    if line == old_line:
-                        break
-            result_lines.append(line)
-        text = "\n".join(result_lines)
-
-        return text
+                lines[index] = line
+        return "\n".join(lines)
 
     @staticmethod
     def fix_unclosed_strings(text: str) -> str:
@@ -153,11 +153,14 @@ class ArrayObjectHandler:
         Improved to handle multiline strings and escaped quotes correctly.
         """
 
+        if '"' not in text:
+            return text
+
         # Safe implementation - basic unclosed string fixing
         lines = text.split("\n")
-        result_lines = []
+        changed = False
 
-        for line in lines:
+        for index, line in enumerate(lines):
             # Simple approach: count quotes in each line
             quote_count = line.count('"')
 
@@ -167,9 +170,9 @@ class ArrayObjectHandler:
                 if stripped.endswith(","):
                     # The comma is structural JSON, not part of the string
                     # Add quote before the comma
-                    line = stripped[:-1] + '",'
+                    lines[index] = stripped[:-1] + '",'
                 else:
-                    line = stripped + '"'
-            result_lines.append(line)
+                    lines[index] = stripped + '"'
+                changed = True
 
-        return "\n".join(result_lines)
+        return "\n".join(lines) if changed else text
@@ -3,7 +3,7 @@ Common constants and mappings used across the jsonshiatsu library.
 """
 
 # Import here to avoid circular imports
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NoReturn
 
 if TYPE_CHECKING:
     from .tokenizer import TokenType
@@ -50,3 +50,8 @@ def get_structural_token_map() -> dict[str, "TokenType"]:
         ":": TokenType.COLON,
         ",": TokenType.COMMA,
     }
+
+
+def reject_constant(constant: str) -> NoReturn:
+    """Reject NaN/Infinity; pass as json.loads parse_constant for strict JSON."""
+    raise ValueError(f"Non-standard constant: {constant}")
@@ -6,10 +6,109 @@ including booleans, null values, special numbers, and empty values.
 """
 
 import re
-from re import Match
+from re import Match, Pattern
 
 from .regex_utils import safe_regex_sub
 
+# Each normalization is a named alternative; _normalize_match dispatches on
+# match.lastgroup so each group of rewrites runs in one pass.
+_BOOLEAN_NULL_PATTERNS = (
+    ("keyword", r"\b(?:True|False|None|NULL|(?i:yes|no|undefined))\b"),
+)
+_SPECIAL_NUMBER_PATTERNS = (
+    ("quoted_special_number", r'"(?:-Infinity|Infinity|NaN)"'),
+    ("special_number", r"-Infinity|Infinity|NaN"),
+    ("hex_number", r"\b0x[0-9a-fA-F]+\b"),
+    ("leading_zero_octal", r"\b0[0-7]+\b"),
+)
+# Delimiters are matched by lookahead and left in place.
+_EXTENDED_NUMBER_PATTERNS = (
+    ("version_number", r"\b\d+\.\d+\.\d+\.\d+\b"),
+    ("trailing_dot", r"\b\d+\.\s*(?=[,\]}])"),
+    ("plus_prefix", r":\s*\+(?=\d)"),
+    ("binary_number", r"0b[01]+"),
+    ("octal_number", r"0o[0-7]+"),
+    ("incomplete_exponent", r"\d+\.?\d*e\s*(?=[,\]}])"),
+)
+_EMPTY_VALUE_PATTERNS = (
+    ("empty_object_value", r":\s*(?=,)"),
+    ("empty_array_value", r",\s*,"),
+    ("missing_final_value", r":\s*(?=[}\]])"),
+)
+
+# Keyword table for the "keyword" pattern; the caseless words match any case
+_KEYWORD_REPLACEMENTS = {
+    "True": "true",
+    "False": "false",
+    "None": "null",
+    "NULL": "null",
+}
+_CASELESS_KEYWORD_REPLACEMENTS = {
+    "yes": "true",
+    "no": "false",
+    "undefined": "null",
+}
+# Prefixed integer literals (0x, 0b, 0o) by pattern name
+_PREFIXED_INTEGER_RADIXES = {
+    "hex_number": 16,
+    "binary_number": 2,
+    "octal_number": 8,
+}
+_CONSTANT_REPLACEMENTS = {
+    "plus_prefix": ": ",
+    "empty_object_value": ": null",
+    "empty_array_value": ", null,",
+    "missing_final_value": ": null",
+}
+
+
+def _compile_alternation(
+    *pattern_groups: tuple[tuple[str, str], ...],
+) -> Pattern[str]:
+    """Compile named patterns into one alternation, tried in the given order."""
+    return re.compile(
+        "|".join(
+            f"(?P<{name}>{source})"
+            for patterns in pattern_groups
+            for name, source in patterns
+        )
+    )
+
+
+_BOOLEAN_NULL_RE = _compile_alternation(_BOOLEAN_NULL_PATTERNS)
+_SPECIAL_NUMBER_RE = _compile_alternation(_SPECIAL_NUMBER_PATTERNS)
+_EXTENDED_NUMBER_RE = _compile_alternation(_EXTENDED_NUMBER_PATTERNS)
+_EMPTY_VALUE_RE = _compile_alternation(_EMPTY_VALUE_PATTERNS)
+
+
+def _normalize_integer(kind: str, token: str) -> str:
+    """Convert a prefixed or leading-zero integer literal to decimal."""
+    if kind in _PREFIXED_INTEGER_RADIXES:
+        return str(int(token[2:], _PREFIXED_INTEGER_RADIXES[kind]))
+    # Like 07 or 00, a single digit after the zero is left alone
+    return str(int(token[1:], 8)) if len(token) > 2 else token
+
+
+def _normalize_match(match: Match[str]) -> str:
+    """Return the replacement for whichever named pattern matched."""
+    kind = match.lastgroup or ""
+    if kind in _CONSTANT_REPLACEMENTS:
+        return _CONSTANT_REPLACEMENTS[kind]
+
+    token = match.group()
+    if kind == "keyword":
+        replacement = _KEYWORD_REPLACEMENTS.get(token)
+        return replacement or _CASELESS_KEYWORD_REPLACEMENTS[token.lower()]
+    if kind in ("special_number", "version_number"):
+        return f'"{token}"'
+    if kind in _PREFIXED_INTEGER_RADIXES or kind == "leading_zero_octal":
+        return _normalize_integer(kind, token)
+    if kind == "trailing_dot":
+        return token.partition(".")[0]
+    if kind == "incomplete_exponent":
+        return token.rstrip() + "0"
+    return token
+
 
 class DataTypeProcessor:
     """Handles data type normalization and processing operations."""
@@ -26,19 +125,7 @@ class DataTypeProcessor:
         - undefined -> null
         - NULL -> null (uppercase variant)
         """
-        text = safe_regex_sub(r"\bTrue\b", "true", text)
-        text = safe_regex_sub(r"\bFalse\b", "false", text)
-        text = safe_regex_sub(r"\bNone\b", "null", text)
-
-        text = safe_regex_sub(r"\byes\b", "true", text, flags=re.IGNORECASE)
-        text = safe_regex_sub(r"\bno\b", "false", text, flags=re.IGNORECASE)
-
-        text = safe_regex_sub(r"\bundefined\b", "null", text, flags=re.IGNORECASE)
-
-        # Uppercase NULL -> null
-        text = safe_regex_sub(r"\bNULL\b", "null", text)
-
-        return text
+        return safe_regex_sub(_BOOLEAN_NULL_RE, _normalize_match, text)
 
     @staticmethod
     def normalize_special_numbers(text: str) -> str:
@@ -46,53 +133,17 @@ class DataTypeProcessor:
         Normalize special number formats and JavaScript constants.
 
         Handles:
-        - NaN -> null
-        - Infinity/-Infinity -> null (or very large numbers)
+        - NaN/Infinity/-Infinity -> quoted string literals (already quoted
+          ones are left alone)
         - Hexadecimal numbers: 0x1A -> 26
-        - Octal numbers: 025 -> 21 (but be careful with valid decimals)
+        - Octal numbers: 025 -> 21 (only digits 0-7 after the leading zero)
+
+        All rewrites run in one scan that does not revisit replaced text, so
+        tokens glued together without a separator are handled one at a time:
+        - A number glued to NaN/Infinity is left alone: 017NaN -> 017"NaN"
+        - Adjacent constants are each quoted: InfinityNaN -> "Infinity""NaN"
         """
-        # Handle NaN and Infinity - convert to string literals for JSON compatibility
-        # Use simple string replacement approach to avoid regex complexity
-        text = text.replace("-Infinity", '"-Infinity"')
-        # This will also handle any remaining Infinity
-        text = text.replace("Infinity", '"Infinity"')
-        text = text.replace("NaN", '"NaN"')
-
-        # Fix the double-quoting issue that may have been created by the
-        # replacements above
-        text = text.replace(
-            '"-"Infinity""', '"-Infinity"'
-        )  # Fix double-quoted -Infinity
-        text = text.replace('""Infinity""', '"Infinity"')  # Fix double-quoted Infinity
-        text = text.replace('""NaN""', '"NaN"')  # Fix double-quoted NaN
-
-        # Handle hexadecimal numbers (0x prefix)
-        def convert_hex(match: Match[str]) -> str:
-            hex_value = match.group(1)
-            try:
-                decimal_value = int(hex_value, 16)
-                return str(decimal_value)
-            except ValueError:
-                return match.group(0)  # Return original if conversion fails
-
-        text = safe_regex_sub(r"\b0x([0-9a-fA-F]+)\b", convert_hex, text)
-
-        # Handle octal numbers (leading zero) - be very conservative
-        # Only convert if it looks like intentional octal (all digits 0-7)
-        def convert_octal(match: Match[str]) -> str:
-            octal_value = match.group(1)
-            # Only convert if all digits are 0-7 and it's not just a leading zero
-            if len(octal_value) > 1 and all(c in "01234567" for c in octal_value):
-                try:
-                    decimal_value = int(octal_value, 8)
-                    return str(decimal_value)
-                except ValueError:
-                    pass
-            return match.group(0)  # Return original
-
-        text = safe_regex_sub(r"\b0([0-7]+)\b", convert_octal, text)
-
-        return text
+        return safe_regex_sub(_SPECIAL_NUMBER_RE, _normalize_match, text)
 
     @staticmethod
     def normalize_extended_numbers(text: str) -> str:
@@ -106,38 +157,12 @@ class DataTypeProcessor:
         - Binary numbers: 0b1010 -> 10 (convert to decimal)
         - Octal numbers: 0o755 -> 493 (convert to decimal)
         - Incomplete scientific: 1.5e -> 1.5e0
-        """
-        # Version numbers like 1.2.3.4 -> "1.2.3.4" (convert to string)
-        text = safe_regex_sub(r"\b(\d+\.\d+\.\d+\.\d+)\b", r'"\1"', text)
-
-        # Trailing dots: 42. -> 42
-        text = safe_regex_sub(r"\b(\d+)\.\s*([,\]}])", r"\1\2", text)
-
-        # Plus prefix: +123 -> 123
-        text = safe_regex_sub(r":\s*\+(\d+)", r": \1", text)
-
-        # Binary numbers: 0b1010 -> 10 (convert to decimal)
-        def convert_binary(match: Match[str]) -> str:
-            try:
-                return str(int(match.group(1), 2))
-            except ValueError:
-                return match.group(0)
 
-        text = safe_regex_sub(r"0b([01]+)", convert_binary, text)
-
-        # Octal numbers: 0o755 -> 493 (convert to decimal)
-        def convert_octal_o(match: Match[str]) -> str:
-            try:
-                return str(int(match.group(1), 8))
-            except ValueError:
-                return match.group(0)
-
-        text = safe_regex_sub(r"0o([0-7]+)", convert_octal_o, text)
-
-        # Incomplete scientific: 1.5e -> 1.5e0
-        text = safe_regex_sub(r"(\d+\.?\d*)e\s*([,\]}])", r"\1e0\2", text)
-
-        return text
+        All rewrites run in one scan that does not revisit replaced text, so a
+        converted number is not merged with what follows it:
+        0b1010o7 -> 10o7 and 0o70b101 -> 56b101.
+        """
+        return safe_regex_sub(_EXTENDED_NUMBER_RE, _normalize_match, text)
 
     @staticmethod
     def handle_empty_values(text: str) -> str:
@@ -150,22 +175,4 @@ class DataTypeProcessor:
         - Incomplete object values: "sms": } -> "sms": null }
         - Empty key with empty value: "": , -> "": null,
         """
-        # Handle empty values after commas in objects
-        # "key": , -> "key": null,
-        text = safe_regex_sub(r":\s*,", ": null,", text)
-
-        # Handle empty values in arrays ,, -> , null,
-        text = safe_regex_sub(r",\s*,", ", null,", text)
-
-        # Handle incomplete values at end of objects/arrays
-        # "key": } -> "key": null }
-        text = safe_regex_sub(r":\s*([}\]])", r": null\1", text)
-
-        # Handle trailing empty values
-        # "key": \n } -> "key": null }
-        text = safe_regex_sub(r":\s*\n\s*([}\]])", r": null\n\1", text)
-
-        # Enhanced: Empty key with empty value: "": , -> "": null,
-        text = safe_regex_sub(r'(""\s*:\s*),', r"\1null,", text)
-
-        return text
+        return safe_regex_sub(_EMPTY_VALUE_RE, _normalize_match, text)
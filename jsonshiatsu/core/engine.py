@@ -2,10 +2,15 @@
 Parser for jsonshiatsu - converts tokens into Python data structures.
 """
 
+import copy
 import io
 import json
 import math
 import re
+import sys
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Iterable
 from typing import Any, Callable, NoReturn, Optional, TextIO, Union
 
 # Import recovery functions - done here to avoid circular imports
@@ -22,35 +27,73 @@ from ..security.exceptions import (
 from ..security.limits import LimitValidator
 from ..streaming.processor import StreamingParser
 from ..utils.config import ParseConfig, ParseLimits, PreprocessingConfig
+from .constants import reject_constant
 from .parser_base import BaseParserMixin
 from .tokenizer import Lexer, Position, Token, TokenType
 from .transformer import JSONPreprocessor
 
+# Doubled backslashes before an escape character, repaired by preprocessing
+_OVER_ESCAPED_RE = re.compile(r'\\\\[nrtbf"\/]')
 
-class TokenCache:
-    """Cache for token access optimization."""
+# String values that start like a line comment, blanked by preprocessing
+_COMMENT_LIKE_STRING_RE = re.compile(r'"\s*//')
 
-    def __init__(self) -> None:
-        self.token: Optional[Token] = None
-        self.pos = -1
+# Escape sequences decoded by Parser._unescape_string
+_STANDARD_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
 
-    def get(self, tokens: list[Token], current_pos: int) -> Token:
-        """Get cached token or fetch new one."""
-        if self.pos != current_pos:
-            if current_pos >= len(tokens):
-                if tokens:
-                    self.token = tokens[-1]
-                else:
-                    # Create a dummy EOF token if no tokens exist
-                    self.token = Token(TokenType.EOF, "", Position(0, 0))
-            else:
-                self.token = tokens[current_pos]
-            self.pos = current_pos
-        return self.token  # type: ignore
+# Object keys up to this length are interned by the token parser
+_INTERN_KEY_MAX_LENGTH = 32
 
-    def invalidate(self) -> None:
-        """Invalidate the cache."""
-        self.pos = -1
+# Only short documents are cached by loads(); long ones are rarely repeated
+_LOADS_CACHE_MAX_LENGTH = 512
+_LOADS_CACHE_MAXSIZE = 256
+
+
+class ResultCache(threading.local):
+    """Per-thread LRU cache of parse results for repeated short inputs.
+
+    Results are stored as private copies and handed out as deep copies, so
+    callers may mutate what they get back.
+    """
+
+    def __init__(self, maxsize: int = _LOADS_CACHE_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._cache: OrderedDict[tuple[str, bool, bool], Any] = OrderedDict()
+
+    def get(self, key: tuple[str, bool, bool]) -> tuple[bool, Any]:
+        """Return (found, value) for a cached parse result."""
+        if key not in self._cache:
+            return False, None
+        self._cache.move_to_end(key)
+        return True, copy.deepcopy(self._cache[key])
+
+    def put(self, key: tuple[str, bool, bool], value: Any) -> None:
+        """Store a parse result, evicting the least recently used entry."""
+        if self.maxsize <= 0:
+            return
+        self._cache[key] = copy.deepcopy(value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached results for the current thread."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_loads_cache = ResultCache()
 
 
 class Parser(BaseParserMixin):
@@ -58,12 +101,14 @@ class Parser(BaseParserMixin):
 
     def __init__(
         self,
-        tokens: list[Token],
+        tokens: Iterable[Token],
         config: ParseConfig,
         error_reporter: Optional[ErrorReporter] = None,
     ):
-        self.tokens = tokens
-        self.pos = 0
+        # Tokens are pulled on demand, so a lexer generator is never buffered
+        self._tokens = iter(tokens)
+        self._lookahead: deque[Token] = deque()
+        self._current = next(self._tokens, Token(TokenType.EOF, "", Position(0, 0)))
         self.config = config
 
         # Optional validator for performance when limits are not needed
@@ -71,44 +116,42 @@ class Parser(BaseParserMixin):
             LimitValidator(config.limits or ParseLimits()) if config.limits else None
         )
         self.error_reporter = error_reporter
-        # Token caching for performance
-        self._cache = TokenCache()
+
+    def _next_token(self) -> Optional[Token]:
+        """Pull the next token from the lookahead buffer or the stream."""
+        if self._lookahead:
+            return self._lookahead.popleft()
+        return next(self._tokens, None)
 
     def current_token(self) -> Token:
-        """Get the current token with caching for performance."""
-        return self._cache.get(self.tokens, self.pos)
+        """Get the current token."""
+        return self._current
 
     def peek_token(self, offset: int = 1) -> Token:
         """Look ahead at a token without advancing position."""
-        pos = self.pos + offset
-        if pos >= len(self.tokens):
-            return (
-                self.tokens[-1]
-                if self.tokens
-                else Token(TokenType.EOF, "", Position(0, 0))
-            )
-        return self.tokens[pos]
+        while len(self._lookahead) < offset:
+            token = next(self._tokens, None)
+            if token is None:
+                return self._lookahead[-1] if self._lookahead else self._current
+            self._lookahead.append(token)
+        return self._lookahead[offset - 1]
 
     def advance(self) -> Token:
         """Move to the next token and return the current token."""
-        token = self.current_token()
-        if self.pos < len(self.tokens) - 1:
-            self.pos += 1
-            self._cache.invalidate()  # Invalidate cache
+        token = self._current
+        next_token = self._next_token()
+        # The last token (EOF) stays current once the stream is exhausted
+        if next_token is not None:
+            self._current = next_token
         return token
 
     def skip_whitespace_and_newlines(self) -> None:
         """Skip over whitespace and newline tokens."""
-        while (
-            self.pos < len(self.tokens)
-            and self.tokens[self.pos].type
-            in (
-                TokenType.WHITESPACE,
-                TokenType.NEWLINE,
-            )
-            and self.current_token().type != TokenType.EOF
-        ):
-            self.advance()
+        while self._current.type in (TokenType.WHITESPACE, TokenType.NEWLINE):
+            next_token = self._next_token()
+            if next_token is None:
+                break
+            self._current = next_token
 
     def _parse_simple_value(self, token: Token) -> tuple[bool, Any]:
         """Parse simple values (string, number, boolean, null). Returns (found, value)."""
@@ -193,6 +236,9 @@ class Parser(BaseParserMixin):
         key_token = self.current_token()
         if key_token.type in [TokenType.STRING, TokenType.IDENTIFIER]:
             key = key_token.value
+            # Keys repeat across records and parses; share one object per name
+            if len(key) <= _INTERN_KEY_MAX_LENGTH and key.isascii():
+                key = sys.intern(key)
             self.advance()
             return key
 
@@ -420,19 +466,8 @@ class Parser(BaseParserMixin):
         next_char = s[i + 1]
 
         # Standard escape sequences
-        escape_map = {
-            '"': '"',
-            "\\": "\\",
-            "/": "/",
-            "b": "\b",
-            "f": "\f",
-            "n": "\n",
-            "r": "\r",
-            "t": "\t",
-        }
-
-        if next_char in escape_map:
-            return escape_map[next_char], i + 2
+        if next_char in _STANDARD_ESCAPES:
+            return _STANDARD_ESCAPES[next_char], i + 2
 
         # Unicode escape sequence
         if next_char == "u" and i + 5 < len(s):
@@ -451,16 +486,17 @@ class Parser(BaseParserMixin):
         if "\\" not in s:
             return s
 
+        # Copy the plain spans between backslashes in one slice each
         result = []
-        i = 0
-        while i < len(s):
-            if s[i] == "\\" and i + 1 < len(s):
-                chars, new_i = self._process_escape_sequence(s, i)
-                result.append(chars)
-                i = new_i
-            else:
-                result.append(s[i])
-                i += 1
+        start = 0
+        last = len(s) - 1  # A trailing backslash has nothing to escape
+        i = s.find("\\")
+        while i != -1 and i < last:
+            result.append(s[start:i])
+            chars, start = self._process_escape_sequence(s, i)
+            result.append(chars)
+            i = s.find("\\", start)
+        result.append(s[start:])
 
         return "".join(result)
 
@@ -473,7 +509,7 @@ class Parser(BaseParserMixin):
 
 
 def loads(
-    s: Union[str, bytes, bytearray],
+    s: Union[str, bytes, bytearray, memoryview],
     *,
     cls: Optional[Any] = None,
     object_hook: Optional[Callable[[dict[str, Any]], Any]] = None,
@@ -492,7 +528,7 @@ def loads(
     Supports all standard json.loads parameters plus jsonshiatsu-specific options.
 
     Standard json.loads parameters:
-        s: JSON string to parse (str, bytes, or bytearray)
+        s: JSON string to parse (str, bytes, bytearray, or memoryview)
         cls: Custom JSONDecoder class (currently ignored)
         object_hook: Function called for each decoded object (dict)
         parse_float: Function to parse JSON floats
@@ -516,9 +552,14 @@ def loads(
     _ = cls  # Custom decoder class not supported
     _ = kw  # Additional keywords ignored
 
-    # Convert bytes/bytearray to string if needed
-    if isinstance(s, (bytes, bytearray)):
-        s = s.decode("utf-8")
+    # Convert binary input to string if needed
+    if isinstance(s, (bytes, bytearray, memoryview)):
+        s = _decode_bytes(s)
+
+    # Default-config results for short inputs only depend on these values
+    cache_key = None
+    if config is None and len(s) <= _LOADS_CACHE_MAX_LENGTH:
+        cache_key = (s, strict, bool(object_pairs_hook))
 
     # Create configuration from parameters
     if config is None:
@@ -534,7 +575,15 @@ def loads(
         )
 
     try:
-        result = _parse_internal(s, config)
+        found, result = _loads_cache.get(cache_key) if cache_key else (False, None)
+        if not found and cache_key:
+            # Standard JSON parses faster than a cache round trip copies it,
+            # so only results that needed repair are cached
+            found, result = _try_standard_json(s, config)
+        if not found:
+            result = _parse_internal(s, config, standard_checked=bool(cache_key))
+            if cache_key:
+                _loads_cache.put(cache_key, result)
 
         # Apply standard json.loads hooks
         if object_pairs_hook:
@@ -556,6 +605,13 @@ def loads(
         raise JsonShiatsuJSONDecodeError(str(e)) from e
 
 
+def _decode_bytes(b: Union[bytes, bytearray, memoryview]) -> str:
+    """Decode binary JSON input, detecting UTF-8/16/32 like json.loads does."""
+    if isinstance(b, memoryview):
+        b = b.tobytes()
+    return b.decode(json.detect_encoding(b), "surrogatepass")
+
+
 def load(
     fp: TextIO,
     *,
@@ -632,13 +688,15 @@ def parse(
     return _parse_internal(text, config)
 
 
-def _parse_internal(text: Union[str, TextIO], config: ParseConfig) -> Any:
+def _parse_internal(
+    text: Union[str, TextIO], config: ParseConfig, standard_checked: bool = False
+) -> Any:
     """Internal parsing function used by both parse() and loads()."""
     if hasattr(text, "read"):
         return _parse_from_stream(text, config)
 
     if isinstance(text, str):
-        return _parse_from_string(text, config)
+        return _parse_from_string(text, config, standard_checked)
 
     raise ValueError("Input must be a string or file-like object")
 
@@ -650,13 +708,26 @@ def _parse_from_stream(text: Union[str, TextIO], config: ParseConfig) -> Any:
     return streaming_parser.parse_stream(stream)
 
 
-def _parse_from_string(text: str, config: ParseConfig) -> Any:
-    """Parse from a string."""
+def _parse_from_string(
+    text: str, config: ParseConfig, standard_checked: bool = False
+) -> Any:
+    """Parse from a string.
+
+    standard_checked is set by callers that already tried the text as
+    standard JSON, so the failed parse is not repeated.
+    """
     _validate_input_size(text, config)
 
     if len(text) > config.streaming_threshold:
         return _parse_via_streaming(text, config)
 
+    if not standard_checked:
+        # Standard JSON needs no preprocessing - parse it directly. This also
+        # avoids infinite loops in preprocessing for already-valid JSON
+        found, result = _try_standard_json(text, config)
+        if found:
+            return result
+
     return _parse_with_preprocessing(text, config)
 
 
@@ -683,29 +754,6 @@ def _parse_with_preprocessing(text: str, config: ParseConfig) -> Any:
         else None
     )
 
-    # Quick check: if text looks like valid JSON, try parsing directly first
-    # This avoids infinite loops in preprocessing for already-valid JSON
-    # But skip direct parsing if there are over-escaped sequences that need processing
-
-    has_over_escaped = bool(re.search(r'\\\\[nrtbf"\/]', text))
-
-    if (
-        text.strip().startswith(("{", "["))
-        and text.strip().endswith(("}", "]"))
-        and "\\" in text
-        and '"' in text
-        and not has_over_escaped
-    ):
-        try:
-            # Try standard JSON parsing first for potentially valid input
-
-            result = json.loads(text)  # Using json module imported at top
-            # If successful, apply any post-processing hooks
-            return result
-        except (json.JSONDecodeError, ValueError):
-            # If standard parsing fails, continue with preprocessing
-            pass
-
     preprocessed_text = JSONPreprocessor.preprocess(
         text, aggressive=config.aggressive, config=config.preprocessing_config
     )
@@ -720,13 +768,53 @@ def _parse_with_preprocessing(text: str, config: ParseConfig) -> Any:
         raise e
 
 
+def _try_standard_json(text: str, config: ParseConfig) -> tuple[bool, Any]:
+    """Parse text with json.loads if it is standard JSON. Returns (found, value)."""
+    stripped = text.strip()
+    if (
+        config.duplicate_keys
+        or not stripped.startswith(("{", "["))
+        or not stripped.endswith(("}", "]"))
+        or _COMMENT_LIKE_STRING_RE.search(text)
+        or ("\\" in text and _OVER_ESCAPED_RE.search(text))
+    ):
+        return False, None
+
+    validator = LimitValidator(config.limits) if config.limits else None
+
+    def parse_number(number_str: str, convert: Callable[[str], Any]) -> Any:
+        if validator:
+            validator.validate_number_length(number_str)
+        return convert(number_str)
+
+    try:
+        result = json.loads(
+            text,
+            parse_int=lambda s: parse_number(s, int),
+            parse_float=lambda s: parse_number(s, float),
+            parse_constant=reject_constant,
+        )
+    except (ValueError, RecursionError):
+        # Not standard JSON (NaN/Infinity included) - preprocess instead
+        return False, None
+
+    if validator:
+        validator.validate_value(result)
+    return True, result
+
+
 def _attempt_primary_parse(
     preprocessed_text: str, config: ParseConfig, error_reporter: Optional[ErrorReporter]
 ) -> Any:
     """Attempt primary parse of preprocessed text."""
+    # Repaired documents are usually standard JSON by now; let the C scanner
+    # handle them and keep the token parser for what is still non-standard
+    found, result = _try_standard_json(preprocessed_text, config)
+    if found:
+        return result
+
     lexer = Lexer(preprocessed_text)
-    tokens = lexer.get_all_tokens()
-    parser = Parser(tokens, config, error_reporter)
+    parser = Parser(lexer.tokenize(), config, error_reporter)
     return parser.parse()
 
 
@@ -794,8 +882,7 @@ def _try_aggressive_preprocessing(
     fallback_text = JSONPreprocessor.preprocess(text, True, fallback_config)
 
     lexer = Lexer(fallback_text)
-    tokens = lexer.get_all_tokens()
-    parser = Parser(tokens, config, error_reporter)
+    parser = Parser(lexer.tokenize(), config, error_reporter)
     return parser.parse()
 
 
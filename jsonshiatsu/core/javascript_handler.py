@@ -9,8 +9,156 @@ import json
 import re
 from re import Match
 
+from .constants import reject_constant
 from .regex_utils import safe_regex_search, safe_regex_sub
 
+# Wrappers around the whole payload, tried in order by unwrap_function_calls
+_FUNCTION_WRAPPER_RE = re.compile(
+    r"^[a-zA-Z_][a-zA-Z0-9_.]*\s*\(\s*(.*)\s*\)\s*;?\s*$", re.DOTALL
+)
+_RETURN_WRAPPER_RE = re.compile(r"^return\s+(.*?)\s*;?\s*$", re.DOTALL | re.IGNORECASE)
+_VARIABLE_WRAPPER_RE = re.compile(
+    r"^(?:const|let|var)\s+\w+\s*=\s*(.*?)\s*;?\s*$", re.DOTALL | re.IGNORECASE
+)
+
+# Common MongoDB/JavaScript function patterns for unwrap_inline_function_calls
+_INLINE_FUNCTION_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in (
+        # Date functions with quoted strings - more precise patterns
+        (r'\bDate\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
+        (r'\bISODate\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
+        (r'\bnew\s+Date\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
+        # ObjectId and UUID functions
+        (r'\bObjectId\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
+        (r'\bUUID\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
+        (r'\bBinData\s*\(\s*\d+\s*,\s*"([^"]*)"\s*\)', r'"\1"'),
+        # RegExp functions - handle both forms
+        # Extract just the pattern string, not regex delimiters
+        (r'\bRegExp\s*\(\s*"([^"]*)"\s*,\s*"([^"]*)"\s*\)', r'"\1"'),
+        (r'\bRegExp\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
+        # MongoDB specific functions
+        (r'\bNumberLong\s*\(\s*"?([^)"]+)"?\s*\)', r"\1"),
+        (r'\bNumberInt\s*\(\s*"?([^)"]+)"?\s*\)', r"\1"),
+        (r'\bNumberDecimal\s*\(\s*"([^"]+)"\s*\)', r'"\1"'),
+        # Handle function calls without quotes (common in LLM output) - more
+        # restrictive
+        (r'\bDate\s*\(\s*([^)"\s,][^),]*)\s*\)', r'"\1"'),
+        (r'\bObjectId\s*\(\s*([^)"\s,][^),]*)\s*\)', r'"\1"'),
+        (r'\bUUID\s*\(\s*([^)"\s,][^),]*)\s*\)', r'"\1"'),
+    )
+)
+_JSON_PARSE_RE = re.compile(
+    r'\bJSON\.parse\s*\(\s*"((?:[^"\\]|\\.)*)"\s*\)', re.IGNORECASE
+)
+
+# Pure numeric expressions evaluated by evaluate_javascript_expressions
+_DIVISION_RE = re.compile(r"\b\d+(?:\.\d+)?\s*/\s*\d+(?:\.\d+)?\b")
+_MODULO_RE = re.compile(r"\b\d+\s*%\s*\d+\b")
+_COMPARISON_RE = re.compile(r"\b\d+(?:\.\d+)?\s*[><]\s*\d+(?:\.\d+)?\b")
+# Rewrites below are keyed by the operator they contain, so a rewrite is
+# only attempted while that operator is still present in the text
+_BOOLEAN_COMBINATIONS = tuple(
+    (operator, re.compile(pattern), replacement)
+    for operator, pattern, replacement in (
+        ("&&", r"\btrue\s*&&\s*false\b", "false"),
+        ("&&", r"\bfalse\s*&&\s*true\b", "false"),
+        ("&&", r"\btrue\s*&&\s*true\b", "true"),
+        ("&&", r"\bfalse\s*&&\s*false\b", "false"),
+        ("||", r"\btrue\s*\|\|\s*false\b", "true"),
+        ("||", r"\bfalse\s*\|\|\s*true\b", "true"),
+        ("||", r"\btrue\s*\|\|\s*true\b", "true"),
+        ("||", r"\bfalse\s*\|\|\s*false\b", "false"),
+    )
+)
+# Expressions that cannot be evaluated safely and become null
+_UNSAFE_EXPRESSIONS = tuple(
+    (operator, re.compile(pattern))
+    for operator, pattern in (
+        ("++", r"\w+\+\+"),  # counter++
+        ("++", r"\+\+\w+"),  # ++counter
+        ("--", r"\w+--"),  # counter--
+        ("--", r"--\w+"),  # --counter
+        ("&&", r"\w+\s*&&\s*\w+"),  # variable && variable
+        ("||", r"\w+\s*\|\|\s*\w+"),  # variable || variable
+    )
+)
+
+# Every expression handled by evaluate_javascript_expressions has an operator
+_EXPRESSION_TRIGGER_RE = re.compile(r"[/%<>&|+-]")
+
+# Constructs rewritten by handle_javascript_constructs
+# Regex literals need a likely-regex context (after :, =, (, [, space or start)
+# so that URLs are left alone
+_REGEX_LITERAL_RE = re.compile(r"(?<=[:\[=\(\s])/([^/]+)/[gimuy]*")
+_LEADING_REGEX_LITERAL_RE = re.compile(r"^/([^/]+)/[gimuy]*")
+_TEMPLATE_LITERAL_RE = re.compile(r"`([^`]*)`")
+_NEW_EXPRESSION_RE = re.compile(r"\bnew\s+\w+\s*\([^)]*\)")
+# Only match if there are numbers and operators, not empty space/comma
+_ARITHMETIC_VALUE_RE = re.compile(
+    r":\s*([0-9]+[\s]*[+\-][\s]*[0-9]+[0-9+\-\s.]*)(?=\s*[,}])"
+)
+
+
+def _is_standard_json(text: str) -> bool:
+    """Return True if text is strict JSON, which no rewrite may alter."""
+    try:
+        json.loads(text, parse_constant=reject_constant)
+    except (ValueError, RecursionError):
+        return False
+    return True
+
+
+def _safe_division(match: Match[str]) -> str:
+    """Evaluate "number / number", falling back to 0."""
+    expr = match.group(0)
+    try:
+        # Parse "number / number"
+        parts = [p.strip() for p in expr.split("/")]
+        if len(parts) == 2:
+            a, b = float(parts[0]), float(parts[1])
+            if b != 0:
+                result = a / b
+                # Return as int if it's a whole number, otherwise float
+                return str(int(result)) if result.is_integer() else str(result)
+        return "0"  # Fallback for division by zero
+    except (ValueError, ZeroDivisionError):
+        return "0"
+
+
+def _safe_modulo(match: Match[str]) -> str:
+    """Evaluate "number % number" on integers, falling back to 0."""
+    expr = match.group(0)
+    try:
+        # Parse "number % number"
+        parts = [p.strip() for p in expr.split("%")]
+        if len(parts) == 2:
+            a, b = int(float(parts[0])), int(float(parts[1]))
+            if b != 0:
+                return str(a % b)
+        return "0"  # Fallback for modulo by zero
+    except (ValueError, ZeroDivisionError):
+        return "0"
+
+
+def _safe_comparison(match: Match[str]) -> str:
+    """Evaluate "number > number" or "number < number"."""
+    expr = match.group(0)
+    try:
+        if ">" in expr:
+            parts = [p.strip() for p in expr.split(">")]
+            if len(parts) == 2:
+                a, b = float(parts[0]), float(parts[1])
+                return "true" if a > b else "false"
+        elif "<" in expr:
+            parts = [p.strip() for p in expr.split("<")]
+            if len(parts) == 2:
+                a, b = float(parts[0]), float(parts[1])
+                return "true" if a < b else "false"
+    except ValueError:
+        pass
+    return "false"  # Conservative default
+
 
 class JavaScriptHandler:
     """Handles JavaScript-specific preprocessing operations."""
@@ -24,12 +172,54 @@ class JavaScriptHandler:
         - // line comments (but not URLs like https://)
         - /* block comments */
         """
-        text = safe_regex_sub(r"/\*.*?\*/", "", text, flags=re.DOTALL)
-        text = safe_regex_sub(
-            r"(?<!https:)(?<!http:)//.*?(?=\n|$)", "", text, flags=re.MULTILINE
-        )
+        # Every comment starts with "/", so skip both scans without one
+        if "/" not in text or _is_standard_json(text):
+            return text
+        text = JavaScriptHandler._remove_block_comments(text)
+        return JavaScriptHandler._remove_line_comments(text)
 
-        return text
+    @staticmethod
+    def _remove_block_comments(text: str) -> str:
+        """Remove /* ... */ comments, leaving an unterminated one in place."""
+        parts = []
+        i = 0
+        while True:
+            start = text.find("/*", i)
+            if start < 0:
+                break
+            end = text.find("*/", start + 2)
+            if end < 0:
+                # No later comment can be terminated either
+                break
+            parts.append(text[i:start])
+            i = end + 2
+        if not parts:
+            return text
+        parts.append(text[i:])
+        return "".join(parts)
+
+    @staticmethod
+    def _remove_line_comments(text: str) -> str:
+        """Remove // comments up to the end of the line, skipping URL schemes."""
+        parts = []
+        i = 0
+        start = text.find("//")
+        while start >= 0:
+            if (start >= 5 and text.startswith("http:", start - 5)) or (
+                start >= 6 and text.startswith("https:", start - 6)
+            ):
+                start = text.find("//", start + 1)
+                continue
+            parts.append(text[i:start])
+            i = text.find("\n", start)
+            if i < 0:
+                i = len(text)
+                break
+            start = text.find("//", i)
+        if not parts:
+            return text
+        parts.append(text[i:])
+        return "".join(parts)
 
     @staticmethod
     def unwrap_function_calls(text: str) -> str:
@@ -42,21 +232,14 @@ class JavaScriptHandler:
         - const data = {"key": "value"}
         """
         text = text.strip()
+        # Each wrapper needs a call, an assignment or a leading return
+        if "(" not in text and "=" not in text and text[:6].lower() != "return":
+            return text
 
-        func_pattern = r"^[a-zA-Z_][a-zA-Z0-9_.]*\s*\(\s*(.*)\s*\)\s*;?\s*$"
-        match = safe_regex_search(func_pattern, text, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-
-        return_pattern = r"^return\s+(.*?)\s*;?\s*$"
-        match = safe_regex_search(return_pattern, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-
-        var_pattern = r"^(?:const|let|var)\s+\w+\s*=\s*(.*?)\s*;?\s*$"
-        match = safe_regex_search(var_pattern, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
+        for pattern in (_FUNCTION_WRAPPER_RE, _RETURN_WRAPPER_RE, _VARIABLE_WRAPPER_RE):
+            match = safe_regex_search(pattern, text)
+            if match:
+                return match.group(1).strip()
 
         return text
 
@@ -73,33 +256,12 @@ class JavaScriptHandler:
         - UUID("123e4567-e89b-12d3-a456-426614174000") →
           "123e4567-e89b-12d3-a456-426614174000"
         """
-        # Common MongoDB/JavaScript function patterns
-        patterns = [
-            # Date functions with quoted strings - more precise patterns
-            (r'\bDate\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
-            (r'\bISODate\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
-            (r'\bnew\s+Date\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
-            # ObjectId and UUID functions
-            (r'\bObjectId\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
-            (r'\bUUID\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
-            (r'\bBinData\s*\(\s*\d+\s*,\s*"([^"]*)"\s*\)', r'"\1"'),
-            # RegExp functions - handle both forms
-            # Extract just the pattern string, not regex delimiters
-            (r'\bRegExp\s*\(\s*"([^"]*)"\s*,\s*"([^"]*)"\s*\)', r'"\1"'),
-            (r'\bRegExp\s*\(\s*"([^"]*)"\s*\)', r'"\1"'),
-            # MongoDB specific functions
-            (r'\bNumberLong\s*\(\s*"?([^)"]+)"?\s*\)', r"\1"),
-            (r'\bNumberInt\s*\(\s*"?([^)"]+)"?\s*\)', r"\1"),
-            (r'\bNumberDecimal\s*\(\s*"([^"]+)"\s*\)', r'"\1"'),
-            # Handle function calls without quotes (common in LLM output) - more
-            # restrictive
-            (r'\bDate\s*\(\s*([^)"\s,][^),]*)\s*\)', r'"\1"'),
-            (r'\bObjectId\s*\(\s*([^)"\s,][^),]*)\s*\)', r'"\1"'),
-            (r'\bUUID\s*\(\s*([^)"\s,][^),]*)\s*\)', r'"\1"'),
-        ]
-
-        for pattern, replacement in patterns:
-            text = safe_regex_sub(pattern, replacement, text, flags=re.IGNORECASE)
+        # Every pattern, JSON.parse() included, is a call
+        if "(" not in text or _is_standard_json(text):
+            return text
+
+        for pattern, replacement in _INLINE_FUNCTION_PATTERNS:
+            text = safe_regex_sub(pattern, replacement, text)
 
         # Handle JSON.parse() with special logic to parse the content
         def parse_json_content(match: Match[str]) -> str:
@@ -113,11 +275,7 @@ class JavaScriptHandler:
                 # If parsing fails, just return the string content
                 return json_str
 
-        # Split long line for readability
-        json_parse_pattern = r'\bJSON\.parse\s*\(\s*"((?:[^"\\]|\\.)*)"\s*\)'
-        text = safe_regex_sub(
-            json_parse_pattern, parse_json_content, text, flags=re.IGNORECASE
-        )
+        text = safe_regex_sub(_JSON_PARSE_RE, parse_json_content, text)
 
         return text
 
@@ -135,92 +293,28 @@ class JavaScriptHandler:
         - Variables and increment operators (counter++)
         - Complex expressions with identifiers
         """
+        if not _EXPRESSION_TRIGGER_RE.search(text) or _is_standard_json(text):
+            return text
 
-        # PHASE 1: Safe arithmetic evaluation
-        def safe_division(match: Match[str]) -> str:
-            expr = match.group(0)
-            try:
-                # Parse "number / number"
-                parts = [p.strip() for p in expr.split("/")]
-                if len(parts) == 2:
-                    a, b = float(parts[0]), float(parts[1])
-                    if b != 0:
-                        result = a / b
-                        # Return as int if it's a whole number, otherwise float
-                        return str(int(result)) if result.is_integer() else str(result)
-                return "0"  # Fallback for division by zero
-            except (ValueError, ZeroDivisionError):
-                return "0"
-
-        def safe_modulo(match: Match[str]) -> str:
-            expr = match.group(0)
-            try:
-                # Parse "number % number"
-                parts = [p.strip() for p in expr.split("%")]
-                if len(parts) == 2:
-                    a, b = int(float(parts[0])), int(float(parts[1]))
-                    if b != 0:
-                        return str(a % b)
-                return "0"  # Fallback for modulo by zero
-            except (ValueError, ZeroDivisionError):
-                return "0"
-
-        # Apply safe arithmetic - only match pure numeric expressions
-        text = safe_regex_sub(
-            r"\b\d+(?:\.\d+)?\s*/\s*\d+(?:\.\d+)?\b", safe_division, text
-        )
-        text = safe_regex_sub(r"\b\d+\s*%\s*\d+\b", safe_modulo, text)
-
-        # PHASE 2: Safe comparison evaluation
-        def safe_comparison(match: Match[str]) -> str:
-            expr = match.group(0)
-            try:
-                if ">" in expr:
-                    parts = [p.strip() for p in expr.split(">")]
-                    if len(parts) == 2:
-                        a, b = float(parts[0]), float(parts[1])
-                        return "true" if a > b else "false"
-                elif "<" in expr:
-                    parts = [p.strip() for p in expr.split("<")]
-                    if len(parts) == 2:
-                        a, b = float(parts[0]), float(parts[1])
-                        return "true" if a < b else "false"
-            except ValueError:
-                pass
-            return "false"  # Conservative default
+        # PHASE 1: Safe arithmetic evaluation, pure numeric expressions only
+        if "/" in text:
+            text = safe_regex_sub(_DIVISION_RE, _safe_division, text)
+        if "%" in text:
+            text = safe_regex_sub(_MODULO_RE, _safe_modulo, text)
 
-        # Apply safe comparisons - only pure numeric comparisons
-        text = safe_regex_sub(
-            r"\b\d+(?:\.\d+)?\s*[><]\s*\d+(?:\.\d+)?\b", safe_comparison, text
-        )
+        # PHASE 2: Safe comparison evaluation, pure numeric comparisons only
+        if ">" in text or "<" in text:
+            text = safe_regex_sub(_COMPARISON_RE, _safe_comparison, text)
 
         # PHASE 3: Known boolean combinations
-        boolean_replacements = [
-            (r"\btrue\s*&&\s*false\b", "false"),
-            (r"\bfalse\s*&&\s*true\b", "false"),
-            (r"\btrue\s*&&\s*true\b", "true"),
-            (r"\bfalse\s*&&\s*false\b", "false"),
-            (r"\btrue\s*\|\|\s*false\b", "true"),
-            (r"\bfalse\s*\|\|\s*true\b", "true"),
-            (r"\btrue\s*\|\|\s*true\b", "true"),
-            (r"\bfalse\s*\|\|\s*false\b", "false"),
-        ]
-
-        for pattern, replacement in boolean_replacements:
-            text = safe_regex_sub(pattern, replacement, text)
+        for operator, pattern, replacement in _BOOLEAN_COMBINATIONS:
+            if operator in text:
+                text = safe_regex_sub(pattern, replacement, text)
 
         # PHASE 4: Convert unsafe expressions to null
-        unsafe_patterns = [
-            r"\w+\+\+",  # counter++
-            r"\+\+\w+",  # ++counter
-            r"\w+--",  # counter--
-            r"--\w+",  # --counter
-            r"\w+\s*&&\s*\w+",  # variable && variable
-            r"\w+\s*\|\|\s*\w+",  # variable || variable
-        ]
-
-        for pattern in unsafe_patterns:
-            text = safe_regex_sub(pattern, "null", text)
+        for operator, pattern in _UNSAFE_EXPRESSIONS:
+            if operator in text:
+                text = safe_regex_sub(pattern, "null", text)
 
         return text
 
@@ -229,15 +323,19 @@ class JavaScriptHandler:
         """Remove JavaScript function definitions entirely."""
         result = []
         i = 0
-        while i < len(text):
-            if JavaScriptHandler._is_function_keyword(text, i):
-                j = JavaScriptHandler._skip_function_definition(text, i)
-                if j > i:
-                    result.append("null")
-                    i = j
-                    continue
-            result.append(text[i])
-            i += 1
+        start = text.find("function")
+        while start >= 0:
+            if JavaScriptHandler._is_function_keyword(text, start):
+                # Copy everything up to the keyword in one slice
+                result.append(text[i:start])
+                result.append("null")
+                i = JavaScriptHandler._skip_function_definition(text, start)
+                start = text.find("function", i)
+            else:
+                start = text.find("function", start + 1)
+        if not result:
+            return text
+        result.append(text[i:])
         return "".join(result)
 
     @staticmethod
@@ -312,10 +410,8 @@ class JavaScriptHandler:
             pattern = pattern.replace('"', '\\"')
             return f'"{pattern}"'
 
-        # Match regex literals but exclude URLs by requiring specific context
-        # Look for: /pattern/flags likely to be regex (after :, =, (, [, start)
-        text = safe_regex_sub(r"(?<=[:\[=\(\s])/([^/]+)/[gimuy]*", convert_regex, text)
-        text = safe_regex_sub(r"^/([^/]+)/[gimuy]*", convert_regex, text)
+        text = safe_regex_sub(_REGEX_LITERAL_RE, convert_regex, text)
+        text = safe_regex_sub(_LEADING_REGEX_LITERAL_RE, convert_regex, text)
         return text
 
     @staticmethod
@@ -355,11 +451,8 @@ class JavaScriptHandler:
             return match.group(0)
 
         # Look for simple arithmetic expressions after colons
-        # Only match if there are numbers and operators, not empty space/comma
         text = safe_regex_sub(
-            r":\s*([0-9]+[\s]*[+\-][\s]*[0-9]+[0-9+\-\s.]*)(?=\s*[,}])",
-            lambda m: ": " + convert_arithmetic(m),
-            text,
+            _ARITHMETIC_VALUE_RE, lambda m: ": " + convert_arithmetic(m), text
         )
         return text
 
@@ -374,20 +467,30 @@ class JavaScriptHandler:
         - Template literals: `hello ${var}` -> "hello ${var}"
         - JavaScript expressions: new Date() -> null
         - String concatenation: 'a' + 'b' -> "ab"
+
+        Text that is already strict JSON is returned unchanged.
         """
+        if _is_standard_json(text):
+            return text
+
         # Remove function definitions entirely
-        text = JavaScriptHandler._remove_function_definitions(text)
+        if "function" in text:
+            text = JavaScriptHandler._remove_function_definitions(text)
 
         # Handle regex literals /pattern/flags -> "pattern"
-        text = JavaScriptHandler._convert_regex_literals(text)
+        if "/" in text:
+            text = JavaScriptHandler._convert_regex_literals(text)
 
         # Handle template literals `text` -> "text" (simple case)
-        text = safe_regex_sub(r"`([^`]*)`", r'"\1"', text)
+        if "`" in text:
+            text = safe_regex_sub(_TEMPLATE_LITERAL_RE, r'"\1"', text)
 
         # Handle new Date() and similar constructor calls
-        text = safe_regex_sub(r"\bnew\s+\w+\s*\([^)]*\)", "null", text)
+        if "new" in text:
+            text = safe_regex_sub(_NEW_EXPRESSION_RE, "null", text)
 
         # Handle arithmetic expressions in JSON context (basic cases)
-        text = JavaScriptHandler._convert_arithmetic_expressions(text)
+        if ":" in text:
+            text = JavaScriptHandler._convert_arithmetic_expressions(text)
 
         return text
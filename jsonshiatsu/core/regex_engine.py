@@ -9,6 +9,8 @@ This module provides a robust regex execution engine that:
 - Works across all platforms (Windows, Linux, macOS)
 """
 
+import functools
+import heapq
 import logging
 import queue
 import re
@@ -16,11 +18,20 @@ import sys
 import threading
 import time
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from re import Match, Pattern
 from typing import Any, Callable, Optional, Union
 
+try:  # Python 3.11+ moved the pattern parser under re
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
 # Try to import the regex module (better timeout support)
 try:
     import regex  # type: ignore[import-untyped]
@@ -147,8 +158,8 @@ class RegexMetrics:
     # Pattern -> timeout count
     timeout_patterns: dict[str, int] = field(default_factory=dict)
 
-    # Pattern -> list of execution times (ms)
-    pattern_timings: dict[str, list[float]] = field(default_factory=dict)
+    # Pattern -> recent execution times (ms), stored unboxed as C doubles
+    pattern_timings: dict[str, "array[float]"] = field(default_factory=dict)
 
     # Lock for thread-safe updates
     _lock: threading.RLock = field(default_factory=threading.RLock)
@@ -182,22 +193,33 @@ class RegexMetrics:
     def record_timing(self, pattern: str, duration_ms: float) -> None:
         """Record pattern execution time."""
         with self._lock:
-            if pattern not in self.pattern_timings:
-                self.pattern_timings[pattern] = []
-            # Keep only last 100 timings per pattern to avoid unbounded growth
-            if len(self.pattern_timings[pattern]) >= 100:
-                self.pattern_timings[pattern].pop(0)
-            self.pattern_timings[pattern].append(duration_ms)
+            self._append_timing(pattern, duration_ms)
+
+    def record_timed_operation(self, pattern: str, duration_ms: float) -> None:
+        """Record an operation and its execution time under a single lock."""
+        with self._lock:
+            self.total_operations += 1
+            self._append_timing(pattern, duration_ms)
+
+    def _append_timing(self, pattern: str, duration_ms: float) -> None:
+        """Append a timing; the caller must hold the lock."""
+        timings = self.pattern_timings.get(pattern)
+        if timings is None:
+            timings = self.pattern_timings[pattern] = array("d")
+        # Keep only last 100 timings per pattern to avoid unbounded growth
+        if len(timings) >= 100:
+            del timings[0]
+        timings.append(duration_ms)
 
     def get_slowest_patterns(self, n: int = 10) -> list[tuple[str, float]]:
         """Get N slowest patterns by average execution time."""
         with self._lock:
-            averages = [
+            averages = (
                 (pattern, sum(times) / len(times))
                 for pattern, times in self.pattern_timings.items()
                 if times
-            ]
-            return sorted(averages, key=lambda x: x[1], reverse=True)[:n]
+            )
+            return heapq.nlargest(n, averages, key=lambda x: x[1])
 
     def get_timeout_rate(self) -> float:
         """Get percentage of operations that timed out."""
@@ -226,50 +248,44 @@ class PatternCache:
     def __init__(self, maxsize: int = 128):
         self.maxsize = maxsize
         self._lock = threading.RLock()
-        # Key: (pattern, flags, backend_name) -> compiled pattern
-        self._cache: dict[tuple[str, int, str], Any] = {}
-        # Track access order for LRU
-        self._access_order: list[tuple[str, int, str]] = []
+        # Key: (pattern, flags, backend_name) -> compiled pattern, kept in
+        # LRU order with the most recently used entry last
+        self._cache: OrderedDict[tuple[str, int, str], Any] = OrderedDict()
 
     def get(self, pattern: str, flags: int, backend_name: str) -> Optional[Any]:
         """Get cached compiled pattern."""
-        key = (pattern, flags, backend_name)
+        key = self._make_key(pattern, flags, backend_name)
 
         with self._lock:
-            if key in self._cache:
-                # Move to end (most recently used)
-                self._access_order.remove(key)
-                self._access_order.append(key)
-                return self._cache[key]
-            return None
+            compiled = self._cache.get(key)
+            if compiled is not None:
+                self._cache.move_to_end(key)
+            return compiled
 
     def put(self, pattern: str, flags: int, backend_name: str, compiled: Any) -> None:
         """Add compiled pattern to cache."""
-        key = (pattern, flags, backend_name)
+        key = self._make_key(pattern, flags, backend_name)
 
         with self._lock:
-            # If already cached, update and move to end
             if key in self._cache:
-                self._access_order.remove(key)
-                self._cache[key] = compiled
-                self._access_order.append(key)
-                return
-
-            # Check if cache is full
-            if len(self._cache) >= self.maxsize > 0:
-                # Remove least recently used
-                oldest = self._access_order.pop(0)
-                del self._cache[oldest]
-
-            # Add new entry
+                # Already cached: update and mark as most recently used
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self.maxsize > 0:
+                # Cache is full: remove least recently used
+                self._cache.popitem(last=False)
             self._cache[key] = compiled
-            self._access_order.append(key)
+
+    @staticmethod
+    def _make_key(
+        pattern: str, flags: int, backend_name: str
+    ) -> tuple[str, int, str]:
+        """Build the cache key; re.UNICODE is implied for str patterns."""
+        return (pattern, flags & ~re.UNICODE, backend_name)
 
     def clear(self) -> None:
         """Clear all cached patterns."""
         with self._lock:
             self._cache.clear()
-            self._access_order.clear()
 
     def size(self) -> int:
         """Get current cache size."""
@@ -277,6 +293,75 @@ class PatternCache:
             return len(self._cache)
 
 
+# ============================================================================
+# Pattern Analysis
+# ============================================================================
+
+# Patterns that try at most this many ways to match from one start position
+# run in time linear in the input and need no timeout protection
+MAX_BACKTRACKING_PATHS = 100
+
+_REPEAT_OPCODES = tuple(
+    getattr(sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_constants, name)
+)
+
+
+def _count_paths(items: Any) -> Optional[int]:
+    """
+    Bound the ways a parsed pattern can match from one position.
+
+    Returns None for unbounded or nested repeats, or when the bound exceeds
+    MAX_BACKTRACKING_PATHS.
+    """
+    total = 1
+    for op, av in items:
+        if op in _REPEAT_OPCODES:
+            low, high, body = av
+            if high == sre_constants.MAXREPEAT or _count_paths(body) != 1:
+                return None
+            paths: Optional[int] = high - low + 1
+        elif op is sre_constants.BRANCH:
+            counts = [_count_paths(branch) for branch in av[1]]
+            paths = None if None in counts else sum(counts)  # type: ignore[arg-type]
+        elif op is sre_constants.GROUPREF_EXISTS:
+            _, yes, no = av
+            counts = [_count_paths(yes), _count_paths(no) if no else 1]
+            paths = None if None in counts else sum(counts)  # type: ignore[arg-type]
+        elif op is sre_constants.SUBPATTERN or op in (
+            sre_constants.ASSERT,
+            sre_constants.ASSERT_NOT,
+        ):
+            paths = _count_paths(av[-1])
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            paths = _count_paths(av)
+        else:
+            paths = 1
+        if paths is None:
+            return None
+        total *= paths
+        if total > MAX_BACKTRACKING_PATHS:
+            return None
+    return total
+
+
+@functools.lru_cache(maxsize=1024)
+def is_linear_pattern(pattern: str, flags: int = 0) -> bool:
+    """
+    Check whether a pattern is guaranteed to run in linear time.
+
+    Only patterns without unbounded repeats qualify: a single ``\\s*`` already
+    makes a failing search quadratic. Patterns the stdlib parser rejects are
+    treated as unsafe, as is any failure of the analysis itself, since it
+    walks the private ``re._parser`` tree, which may change between releases.
+    """
+    try:
+        return _count_paths(sre_parse.parse(pattern, flags)) is not None
+    except Exception:
+        return False
+
+
 # ============================================================================
 # Abstract Backend Interface
 # ============================================================================
@@ -351,8 +436,7 @@ class RegexBackend(ABC):
     ) -> None:
         """Record metrics if enabled."""
         if self.metrics:
-            self.metrics.record_operation()
-            self.metrics.record_timing(pattern_str, duration_ms)
+            self.metrics.record_timed_operation(pattern_str, duration_ms)
 
             if (
                 self.config.log_slow_patterns
@@ -1027,6 +1111,21 @@ class RegexEngine:
 
         return compiled  # type: ignore[no-any-return]
 
+    def _runs_untimed(
+        self, pattern: str, flags: int, timeout: Optional[float], configured: float
+    ) -> bool:
+        """
+        Check whether a call can skip the backend and run the pattern directly.
+
+        That is the case when there are no metrics to record and either no
+        timeout is asked for or the pattern cannot backtrack catastrophically.
+        """
+        if self.backend.metrics is not None:
+            return False
+        if timeout is None and configured <= 0:
+            return True
+        return is_linear_pattern(pattern, flags)
+
     def search(
         self,
         pattern: str,
@@ -1050,6 +1149,8 @@ class RegexEngine:
             RegexTimeoutError: If operation times out (depending on config)
         """
         compiled = self._get_compiled_pattern(pattern, flags)
+        if self._runs_untimed(pattern, flags, timeout, self.config.search_timeout):
+            return compiled.search(string)  # type: ignore[no-any-return]
         try:
             return self.backend.search(compiled, string, timeout)  # type: ignore[no-any-return]
         except RegexTimeoutError:
@@ -1064,6 +1165,8 @@ class RegexEngine:
     ) -> Optional[Match[str]]:
         """Match pattern at start of string."""
         compiled = self._get_compiled_pattern(pattern, flags)
+        if self._runs_untimed(pattern, flags, timeout, self.config.search_timeout):
+            return compiled.match(string)  # type: ignore[no-any-return]
         try:
             return self.backend.match(compiled, string, timeout)  # type: ignore[no-any-return]
         except RegexTimeoutError:
@@ -1084,6 +1187,8 @@ class RegexEngine:
         Returns original string on timeout (configurable).
         """
         compiled = self._get_compiled_pattern(pattern, flags)
+        if self._runs_untimed(pattern, flags, timeout, self.config.sub_timeout):
+            return compiled.sub(repl, string, count)  # type: ignore[no-any-return]
         try:
             return self.backend.sub(compiled, repl, string, count, timeout)  # type: ignore[no-any-return]
         except RegexTimeoutError:
@@ -1098,6 +1203,8 @@ class RegexEngine:
     ) -> list[str]:
         """Find all non-overlapping matches."""
         compiled = self._get_compiled_pattern(pattern, flags)
+        if self._runs_untimed(pattern, flags, timeout, self.config.findall_timeout):
+            return compiled.findall(string)  # type: ignore[no-any-return]
         try:
             return self.backend.findall(compiled, string, timeout)  # type: ignore[no-any-return]
         except RegexTimeoutError:
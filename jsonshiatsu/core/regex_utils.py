@@ -5,11 +5,22 @@ This module provides timeout-protected regex operations to prevent
 infinite loops from catastrophic backtracking in complex patterns.
 """
 
+import functools
 import re
-import signal
-from re import Match
+import sys
+import threading
+from re import Match, Pattern
 from typing import Any, Callable, Optional, Union
 
+# SIGALRM does not exist on Windows; there the operations run unguarded
+SIGNALS_AVAILABLE = sys.platform != "win32"
+if SIGNALS_AVAILABLE:
+    import signal
+
+# Non-empty patterns without metacharacters match their own text exactly, so
+# str methods can answer for them (or rule out a match) without the regex
+_LITERAL_RE = re.compile(r"[^.^$*+?{}\[\]\\|()]+\Z")
+
 
 class RegexTimeout(Exception):
     """Exception raised when regex operation exceeds timeout."""
@@ -20,8 +31,43 @@ def timeout_handler(signum: int, frame: Any) -> None:
     raise RegexTimeout("Regex operation timed out")
 
 
+@functools.lru_cache(maxsize=512)
+def _compile(pattern: Union[str, Pattern[str]], flags: int) -> Pattern[str]:
+    """Compile a pattern once per (pattern, flags) pair."""
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=512)
+def _literal_text(pattern: Union[str, Pattern[str]], flags: int) -> Optional[str]:
+    """Return the pattern if it only matches itself, else None."""
+    if isinstance(pattern, str) and not flags and _LITERAL_RE.match(pattern):
+        return pattern
+    return None
+
+
+def _start_alarm(timeout: int) -> None:
+    """Arm the timeout alarm, installing timeout_handler only when needed."""
+    # Installing a handler costs a syscall, several times the price of a short
+    # regex call. Off the main thread signal.signal still raises ValueError,
+    # which callers treat as a failed operation.
+    if not SIGNALS_AVAILABLE:
+        return
+    if (
+        signal.getsignal(signal.SIGALRM) is not timeout_handler
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        signal.signal(signal.SIGALRM, timeout_handler)
+    signal.alarm(timeout)
+
+
+def _stop_alarm() -> None:
+    """Disarm the timeout alarm armed by _start_alarm."""
+    if SIGNALS_AVAILABLE:
+        signal.alarm(0)
+
+
 def safe_regex_sub(
-    pattern: str,
+    pattern: Union[str, Pattern[str]],
     repl: Union[str, Callable[[Match[str]], str]],
     string: str,
     flags: int = 0,
@@ -31,7 +77,7 @@ def safe_regex_sub(
     Perform regex substitution with timeout protection.
 
     Args:
-        pattern: Regular expression pattern
+        pattern: Regular expression pattern (string or precompiled)
         repl: Replacement string or function
         string: Input string to process
         flags: Regex flags
@@ -41,10 +87,12 @@ def safe_regex_sub(
         String with substitutions applied, or original string if timeout/error
     """
     try:
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
-        result = re.sub(pattern, repl, string, flags=flags)
-        signal.alarm(0)
+        literal = _literal_text(pattern, flags)
+        if literal and isinstance(repl, str) and "\\" not in repl:
+            return string.replace(literal, repl)
+        _start_alarm(timeout)
+        result = _compile(pattern, flags).sub(repl, string)
+        _stop_alarm()
         return result
     except RegexTimeout:
         return string
@@ -53,13 +101,16 @@ def safe_regex_sub(
 
 
 def safe_regex_search(
-    pattern: str, string: str, flags: int = 0, timeout: int = 5
+    pattern: Union[str, Pattern[str]],
+    string: str,
+    flags: int = 0,
+    timeout: int = 5,
 ) -> Optional[Match[str]]:
     """
     Perform regex search with timeout protection.
 
     Args:
-        pattern: Regular expression pattern
+        pattern: Regular expression pattern (string or precompiled)
         string: Input string to search
         flags: Regex flags
         timeout: Timeout in seconds
@@ -68,10 +119,12 @@ def safe_regex_search(
         Match object if found, None if no match or timeout/error
     """
     try:
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
-        result = re.search(pattern, string, flags=flags)
-        signal.alarm(0)
+        literal = _literal_text(pattern, flags)
+        if literal and literal not in string:
+            return None
+        _start_alarm(timeout)
+        result = _compile(pattern, flags).search(string)
+        _stop_alarm()
         return result
     except RegexTimeout:
         return None
@@ -80,13 +133,16 @@ def safe_regex_search(
 
 
 def safe_regex_findall(
-    pattern: str, string: str, flags: int = 0, timeout: int = 5
+    pattern: Union[str, Pattern[str]],
+    string: str,
+    flags: int = 0,
+    timeout: int = 5,
 ) -> list[str]:
     """
     Perform regex findall with timeout protection.
 
     Args:
-        pattern: Regular expression pattern
+        pattern: Regular expression pattern (string or precompiled)
         string: Input string to search
         flags: Regex flags
         timeout: Timeout in seconds
@@ -95,10 +151,12 @@ def safe_regex_findall(
         List of matches, empty list if timeout/error
     """
     try:
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
-        result = re.findall(pattern, string, flags=flags)
-        signal.alarm(0)
+        literal = _literal_text(pattern, flags)
+        if literal:
+            return [literal] * string.count(literal)
+        _start_alarm(timeout)
+        result = _compile(pattern, flags).findall(string)
+        _stop_alarm()
         return result
     except RegexTimeout:
         return []
@@ -107,13 +165,16 @@ def safe_regex_findall(
 
 
 def safe_regex_match(
-    pattern: str, string: str, flags: int = 0, timeout: int = 5
+    pattern: Union[str, Pattern[str]],
+    string: str,
+    flags: int = 0,
+    timeout: int = 5,
 ) -> Optional[Match[str]]:
     """
     Perform regex match with timeout protection.
 
     Args:
-        pattern: Regular expression pattern
+        pattern: Regular expression pattern (string or precompiled)
         string: Input string to match
         flags: Regex flags
         timeout: Timeout in seconds
@@ -122,10 +183,12 @@ def safe_regex_match(
         Match object if found, None if no match or timeout/error
     """
     try:
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
-        result = re.match(pattern, string, flags=flags)
-        signal.alarm(0)
+        literal = _literal_text(pattern, flags)
+        if literal and not string.startswith(literal):
+            return None
+        _start_alarm(timeout)
+        result = _compile(pattern, flags).match(string)
+        _stop_alarm()
         return result
     except RegexTimeout:
         return None
@@ -16,6 +16,93 @@ from .regex_utils import (
     safe_regex_sub,
 )
 
+# Patterns used by StringPreprocessor.fix_unescaped_strings, compiled once
+_STRING_LITERAL_RE = re.compile(r'"([^"]*)"')
+_DRIVE_LETTER_RE = re.compile(r"(?:^|[\s/\\])[a-zA-Z]:")
+_BACKSLASH_FILE_EXTENSION_RE = re.compile(r"\\[^u\\]+\.[a-zA-Z0-9]{1,4}$")
+_FILE_NAME_EXTENSION_RE = re.compile(r"[a-zA-Z0-9_-]+\.[a-zA-Z0-9]{1,4}$")
+_QUOTED_STRING_CONTENT_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
+_PLUS_CONCATENATION_RE = re.compile(r'"(?:[^"\\]|\\.)*"(?:\s*\+\s*"(?:[^"\\]|\\.)*")+')
+_PROBLEMATIC_BACKSLASH_RE = re.compile(r"(?<!\\)\\(?![\\\"/bfnrtu]|u[0-9a-fA-F]{4}|$)")
+_OVER_ESCAPED_PATTERNS = [
+    (re.compile(r"\\\\n"), r"\\n"),  # \\n -> \n
+    (re.compile(r"\\\\t"), r"\\t"),  # \\t -> \t
+    (re.compile(r"\\\\r"), r"\\r"),  # \\r -> \r
+    (re.compile(r"\\\\b"), r"\\b"),  # \\b -> \b
+    (re.compile(r"\\\\f"), r"\\f"),  # \\f -> \f
+    (re.compile(r'\\\\"'), r'\\"'),  # \\" -> \"
+    (re.compile(r"\\\\/"), r"\\/"),  # \\/ -> \/
+    (re.compile(r"\\\\\\\\"), r"\\\\"),  # \\\\ -> \\
+]
+
+# Patterns used by the quote fixing and string concatenation handlers
+_ASSIGNMENT_RE = re.compile(r'"\s*=\s*[^=]|^\s*\w+\s*=\s*')
+_SPACED_STRINGS_RE = re.compile(r'"\s+"[^:]')
+_ADJACENT_OBJECTS_RE = re.compile(r"\}\s*\{")
+_SINGLE_QUOTED_RE = re.compile(r"'([^']*)'")
+_LAZY_STRING_LITERAL_RE = re.compile(r'"([^"]*?)"')
+_PAREN_CONCATENATION_RE = re.compile(
+    r'\(\s*("(?:[^"\\]|\\.)*?"(?:\s+"(?:[^"\\]|\\.)*?")*)\s*\)'
+)
+_ADJACENT_STRINGS_RE = re.compile(r'"([^"]*?)"\s+"([^"]*?)"')
+_MIXED_QUOTED_STRING_RE = re.compile(r"['\"]([^'\"]*)['\"]")
+_MIXED_QUOTE_CONCATENATION_RE = re.compile(
+    r"['\"][^'\"\\]*(?:\\.[^'\"\\]*)*['\"]"
+    r"(?:\s*\+\s*['\"][^'\"\\]*(?:\\.[^'\"\\]*)*['\"])+"
+)
+_ESCAPED_QUOTE_CONCATENATION_RE = re.compile(r'"[^"\\]+\\"\s*\+\s*\\"[^"\\]+"')
+_PLUS_OPERATOR_RE = re.compile(r"\s*\+\s*")
+_WHOLE_QUOTED_STRING_RE = re.compile(r'"(.*)"')
+
+# Characters that may follow a backslash in a JSON escape sequence
+_JSON_ESCAPE_CHARS = frozenset('\\"/bfnrtu')
+
+# Path components that mark a backslash-containing string as a file path
+_FILE_PATH_INDICATORS = (
+    "data",
+    "file",
+    "temp",
+    "usr",
+    "var",
+    "home",
+    "program",
+    "windows",
+    "documents",
+    "desktop",
+    "downloads",
+    "system",
+    "config",
+    "etc",
+    "bin",
+    "lib",
+    "src",
+    "test",
+    "backup",
+    "log",
+    "cache",
+    "tmp",
+)
+
+
+def _has_json_escape(content: str) -> bool:
+    """Check whether any backslash in content starts a JSON escape sequence."""
+    pos = content.find("\\")
+    while pos != -1:
+        if content[pos + 1 : pos + 2] in _JSON_ESCAPE_CHARS:
+            return True
+        pos = content.find("\\", pos + 1)
+    return False
+
+
+def _has_non_json_escape(content: str) -> bool:
+    """Check whether any backslash in content is not a JSON escape sequence."""
+    pos = content.find("\\")
+    while pos != -1:
+        if content[pos + 1 : pos + 2] not in _JSON_ESCAPE_CHARS:
+            return True
+        pos = content.find("\\", pos + 1)
+    return False
+
 
 class StringPreprocessor:
     """Handles string-specific preprocessing operations."""
@@ -41,77 +128,49 @@ class StringPreprocessor:
                 return full_match
 
             # Detect if this looks like a file path or similar literal string
-            file_indicators = [
-                "data",
-                "file",
-                "temp",
-                "usr",
-                "var",
-                "home",
-                "program",
-                "windows",
-                "documents",
-                "desktop",
-                "downloads",
-                "system",
-                "config",
-                "etc",
-                "bin",
-                "lib",
-                "src",
-                "test",
-                "backup",
-                "log",
-                "cache",
-                "tmp",
-            ]
-
             content_lower = content.lower()
             # If the string contains valid JSON escape sequences (Unicode or
             # standard escapes),
             # be very conservative about treating it as a file path
-            has_json_escapes = safe_regex_search(
-                r'\\[\\"/bfnrtu]|\\u[0-9a-fA-F]{4}', content
-            )
+            has_json_escapes = _has_json_escape(content)
 
             if has_json_escapes:
                 # Only treat as file path if it has strong file path indicators
                 looks_like_path = (
                     # Contains common path components
-                    any(indicator in content_lower for indicator in file_indicators)
+                    any(
+                        indicator in content_lower
+                        for indicator in _FILE_PATH_INDICATORS
+                    )
                     or
                     # Contains drive letters (C:, D:, etc.) - must be start of string or
                     # after space/slash
-                    safe_regex_search(r"(?:^|[\s/\\])[a-zA-Z]:", content)
+                    safe_regex_search(_DRIVE_LETTER_RE, content)
                 )
             else:
                 # No JSON escapes - use broader file path detection
                 looks_like_path = (
                     # Contains common path components
-                    any(indicator in content_lower for indicator in file_indicators)
+                    any(
+                        indicator in content_lower
+                        for indicator in _FILE_PATH_INDICATORS
+                    )
                     or
                     # Contains drive letters (C:, D:, etc.) - must be start of string or
                     # after space/slash
-                    safe_regex_search(r"(?:^|[\s/\\])[a-zA-Z]:", content)
+                    safe_regex_search(_DRIVE_LETTER_RE, content)
                     or
                     # Contains actual path separators (not JSON escape sequences)
                     # Only consider it a path if there are backslashes that are NOT
                     # valid JSON escapes
-                    (
-                        content.count("\\") >= 2
-                        and safe_regex_search(
-                            r'\\(?![\\"/bfnrtu]|u[0-9a-fA-F]{4})', content
-                        )
-                    )
+                    (content.count("\\") >= 2 and _has_non_json_escape(content))
                     or
                     # Contains common file extensions (but not Unicode escapes)
                     # Must be a backslash followed by path components and an extension
-                    safe_regex_search(r"\\[^u\\]+\.[a-zA-Z0-9]{1,4}$", content)
+                    safe_regex_search(_BACKSLASH_FILE_EXTENSION_RE, content)
                     or
                     # Or a regular path with extension at the end
-                    safe_regex_search(
-                        r"[a-zA-Z0-9_-]+\.[a-zA-Z0-9]{1,4}$", content.split("\\")[-1]
-                    )
+                    safe_regex_search(_FILE_NAME_EXTENSION_RE, content.split("\\")[-1])
                 )
 
             if looks_like_path:
@@ -126,21 +185,23 @@ class StringPreprocessor:
             # followed by a character that would cause JSON parsing issues
             # Check if there are problematic unescaped backslashes first
             has_problematic_backslashes = safe_regex_search(
-                r"(?<!\\)\\(?![\\\"/bfnrtu]|u[0-9a-fA-F]{4}|$)", content
+                _PROBLEMATIC_BACKSLASH_RE, content
             )
 
             if has_problematic_backslashes:
                 # Only escape problematic backslashes
                 escaped_content = safe_regex_sub(
-                    r"(?<!\\)\\(?![\\\"/bfnrtu]|u[0-9a-fA-F]{4}|$)",
-                    r"\\\\",
-                    content,
+                    _PROBLEMATIC_BACKSLASH_RE, r"\\\\", content
                 )
                 return f'"{escaped_content}"'
 
             # No problematic backslashes found, return unchanged
             return full_match
 
+        # Both passes below only rewrite string literals containing backslashes
+        if "\\" not in text:
+            return text
+
         # Track strings that were processed as file paths to avoid double-processing
         processed_file_paths = set()
 
@@ -149,41 +210,31 @@ class StringPreprocessor:
             # If the result was changed (escaped), track the new content
             if result != match.group(0):
                 # Extract the new content from the result
-                new_content_match = safe_regex_match(r'"([^"]*)"', result)
+                new_content_match = safe_regex_match(_STRING_LITERAL_RE, result)
                 if new_content_match:
                     processed_file_paths.add(new_content_match.group(1))
             return result
 
-        text = safe_regex_sub(r'"([^"]*)"', fix_file_paths_with_tracking, text)
+        text = safe_regex_sub(_STRING_LITERAL_RE, fix_file_paths_with_tracking, text)
 
         # Also handle over-escaped sequences (common in malformed JSON)
         # Convert \\n to \n, \\t to \t, etc. within strings
         def fix_over_escaped(match: Match[str]) -> str:
             content = match.group(1)
 
-            # Skip over-escaped processing for strings that were already processed as file paths
-            if content in processed_file_paths:
+            # Skip over-escaped processing for strings that were already processed
+            # as file paths, and for strings with nothing to unescape
+            if "\\" not in content or content in processed_file_paths:
                 return match.group(0)
 
             # Convert common over-escaped sequences
             # \\n -> \n, \\t -> \t, \\r -> \r, etc.
-            over_escaped_patterns = [
-                (r"\\\\n", r"\\n"),  # \\n -> \n
-                (r"\\\\t", r"\\t"),  # \\t -> \t
-                (r"\\\\r", r"\\r"),  # \\r -> \r
-                (r"\\\\b", r"\\b"),  # \\b -> \b
-                (r"\\\\f", r"\\f"),  # \\f -> \f
-                (r'\\\\"', r'\\"'),  # \\" -> \"
-                (r"\\\\/", r"\\/"),  # \\/ -> \/
-                (r"\\\\\\\\", r"\\\\"),  # \\\\ -> \\
-            ]
-
-            for pattern, replacement in over_escaped_patterns:
+            for pattern, replacement in _OVER_ESCAPED_PATTERNS:
                 content = safe_regex_sub(pattern, replacement, content)
 
             return f'"{content}"'
 
-        text = safe_regex_sub(r'"([^"]*)"', fix_over_escaped, text)
+        text = safe_regex_sub(_STRING_LITERAL_RE, fix_over_escaped, text)
 
         return text
 
@@ -200,9 +251,9 @@ class StringPreprocessor:
         if (
             open_braces > 0
             or open_brackets > 0
-            or safe_regex_search(r'"\s*=\s*[^=]|^\s*\w+\s*=\s*', text)
-            or safe_regex_search(r'"\s+"[^:]', text)
-            or safe_regex_search(r"\}\s*\{", text)
+            or safe_regex_search(_ASSIGNMENT_RE, text)
+            or safe_regex_search(_SPACED_STRINGS_RE, text)
+            or safe_regex_search(_ADJACENT_OBJECTS_RE, text)
         ):
             return True
 
@@ -354,9 +405,8 @@ class StringPreprocessor:
         for i, part in enumerate(parts):
             if i % 2 == 0:
                 # Outside string - can safely convert single quotes
-                single_quote_pattern = r"'([^']*)'"
                 converted_part = safe_regex_sub(
-                    single_quote_pattern,
+                    _SINGLE_QUOTED_RE,
                     fix_concatenation_in_single_quotes,
                     part,
                 )
@@ -457,53 +507,20 @@ class StringPreprocessor:
         - "string1" "string2" -> "string1string2" (Adjacent implicit concat)
         """
 
-        # Custom approach to handle string concatenation with proper
-        # escaped quote handling
+        # Merge each whole "a" + "b" + ... chain in one pass, joining the
+        # parts once instead of re-concatenating pairs
         def replace_concatenation(match: Match[str]) -> str:
-            # Extract the full match
-            full_match = match.group(0)
-
-            # Find the position of the + operator
-            plus_pos = full_match.find("+")
-            if plus_pos == -1:
-                return full_match
-
-            # Split the text at the plus operator
-            left_part = full_match[:plus_pos].strip()
-            right_part = full_match[plus_pos + 1 :].strip()
-
-            # Extract content from quoted strings
-            def extract_string_content(quoted_str: str) -> str:
-                if not (quoted_str.startswith('"') and quoted_str.endswith('"')):
-                    return quoted_str
-
-                # Remove surrounding quotes
-                content = quoted_str[1:-1]
-
-                # Handle escaped quotes correctly
-                # Replace escaped quotes with actual quotes
-                content = content.replace('\\"', '"')
-                return content
-
-            # Extract content from both parts
-            left_content = extract_string_content(left_part)
-            right_content = extract_string_content(right_part)
-
-            # Combine and return as a new quoted string
-            combined = left_content + right_content
+            parts = [
+                content.replace('\\"', '"')
+                for content in safe_regex_findall(
+                    _QUOTED_STRING_CONTENT_RE, match.group(0)
+                )
+            ]
             # Escape any quotes in the combined content
-            combined = combined.replace('"', '\\"')
+            combined = "".join(parts).replace('"', '\\"')
             return f'"{combined}"'
 
-        # Pattern to match string concatenation with proper handling of escaped quotes
-        # This pattern looks for quoted strings separated by +
-        plus_pattern = r'"(?:[^"\\]|\\.)*"\s*\+\s*"(?:[^"\\]|\\.)*"'
-
-        max_iterations = 10
-        iteration = 0
-        while safe_regex_search(plus_pattern, text) and iteration < max_iterations:
-            iteration += 1
-            text = safe_regex_sub(plus_pattern, replace_concatenation, text)
+        text = safe_regex_sub(_PLUS_CONCATENATION_RE, replace_concatenation, text)
 
         # Handle Python-style parentheses concatenation
         # Pattern: ("string1" "string2" "string3") -> "string1string2string3"
@@ -512,17 +529,15 @@ class StringPreprocessor:
         def fix_paren_concatenation(match: Match[str]) -> str:
             content = match.group(1)
             # Find all quoted strings within the parentheses
-            string_pattern = r'"([^"]*?)"'
-            strings = safe_regex_findall(string_pattern, content)
+            strings = safe_regex_findall(_LAZY_STRING_LITERAL_RE, content)
             if strings:
                 # Concatenate all strings
                 combined = "".join(strings)
                 return f'"{combined}"'
             return match.group(0)
 
-        # Pattern to match parentheses containing multiple quoted strings
-        paren_pattern = r'\(\s*("(?:[^"\\]|\\.)*?"(?:\s+"(?:[^"\\]|\\.)*?")*)\s*\)'
-        text = safe_regex_sub(paren_pattern, fix_paren_concatenation, text)
+        # Match parentheses containing multiple quoted strings
+        text = safe_regex_sub(_PAREN_CONCATENATION_RE, fix_paren_concatenation, text)
 
         # Handle adjacent quoted strings (implicit concatenation)
         # But be careful not to merge JSON key-value pairs!
@@ -585,12 +600,14 @@ class StringPreprocessor:
             return f'"{first_string}{second_string}"'
 
         # Pattern: "string1" "string2" -> "string1string2" (but only when appropriate)
-        adjacent_pattern = r'"([^"]*?)"\s+"([^"]*?)"'
-
+        max_iterations = 10
         iteration = 0
-        while safe_regex_search(adjacent_pattern, text) and iteration < max_iterations:
+        while (
+            safe_regex_search(_ADJACENT_STRINGS_RE, text)
+            and iteration < max_iterations
+        ):
             iteration += 1
-            text = safe_regex_sub(adjacent_pattern, safe_string_merge, text)
+            text = safe_regex_sub(_ADJACENT_STRINGS_RE, safe_string_merge, text)
 
         return text
 
@@ -612,14 +629,14 @@ class StringPreprocessor:
             # Extract the string contents and concatenate them
 
             # Find all quoted strings in the concatenation
-            strings = safe_regex_search(r"['\"]([^'\"]*)['\"]", full_expr)
+            strings = safe_regex_search(_MIXED_QUOTED_STRING_RE, full_expr)
             if strings:
                 # Simple approach: extract content between first and last quote markers
                 content = full_expr
                 # Remove + operators and quotes, then rejoin
                 content = content.replace("'", '"').replace(" + ", "").replace("+", "")
                 # Extract just the content parts
-                string_contents = safe_regex_findall(r'"([^"]*)"', content)
+                string_contents = safe_regex_findall(_STRING_LITERAL_RE, content)
                 if string_contents:
                     combined = "".join(string_contents)
                     return f'"{combined}"'
@@ -631,13 +648,13 @@ class StringPreprocessor:
             # Split on + operator first, then extract content from each part
 
             # Split the expression by + operator (with optional whitespace)
-            parts = re.split(r"\s*\+\s*", concat_expr)
+            parts = _PLUS_OPERATOR_RE.split(concat_expr)
             content_parts = []
 
             for part in parts:
                 part = part.strip()
                 # Extract content from quoted string
-                match = safe_regex_match(r'"(.*)"', part)
+                match = safe_regex_match(_WHOLE_QUOTED_STRING_RE, part)
                 if match:
                     content = match.group(1)
                     # Unescape the content
@@ -651,14 +668,12 @@ class StringPreprocessor:
             return f'"{combined}"'
 
         # Handle mixed quote concatenation patterns (including escaped quotes)
-        concat_pattern = (
-            r"['\"][^'\"\\]*(?:\\.[^'\"\\]*)*['\"]"
-            r"(?:\s*\+\s*['\"][^'\"\\]*(?:\\.[^'\"\\]*)*['\"])+"
+        text = safe_regex_sub(
+            _MIXED_QUOTE_CONCATENATION_RE, fix_mixed_concat_quotes, text
         )
-        text = safe_regex_sub(concat_pattern, fix_mixed_concat_quotes, text)
         # Also handle already-normalized quotes with escapes like "single\" + \"double"
         text = safe_regex_sub(
-            r'"[^"\\]+\\"\s*\+\s*\\"[^"\\]+"',
+            _ESCAPED_QUOTE_CONCATENATION_RE,
             lambda m: fix_escaped_concat(m.group(0)),
             text,
         )
@@ -2,6 +2,7 @@
 Lexer for jsonshiatsu - tokenizes input strings for parsing.
 """
 
+import re
 from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
@@ -47,6 +48,28 @@ class Token(NamedTuple):
     position: Position
 
 
+_STRUCTURAL_TOKEN_MAP = get_structural_token_map()
+_KEYWORD_TOKEN_TYPES = {
+    "true": TokenType.BOOLEAN,
+    "false": TokenType.BOOLEAN,
+    "null": TokenType.NULL,
+}
+
+# Runs the lexer can consume in one step instead of character by character
+_WHITESPACE_RUN_RE = re.compile(r"[ \t\r]+")
+_STRING_RUN_RES = {
+    '"': re.compile(r'[^"\\\n]+'),
+    "'": re.compile(r"[^'\\\n]+"),
+}
+_UNICODE_ESCAPE_RUN_RE = re.compile(r"(?:\\u[0-9a-fA-F]{4})+")
+
+
+def _decode_unicode_escapes(escapes: str) -> str:
+    """Decode a run of \\uXXXX escapes as UTF-16, replacing lone surrogates."""
+    code_units = bytes.fromhex(escapes.replace("\\u", ""))
+    return code_units.decode("utf-16-be", "replace")
+
+
 class Lexer:
     """Lexical analyzer for JSON input."""
 
@@ -85,32 +108,43 @@ class Lexer:
 
     def skip_whitespace(self) -> None:
         """Skip whitespace characters (space, tab, carriage return)."""
-        while self.pos < len(self.text) and self.text[self.pos] in " \t\r":
-            self.advance()
+        match = _WHITESPACE_RUN_RE.match(self.text, self.pos)
+        if match:
+            self._skip_run(match.end())
+
+    def _skip_run(self, end: int) -> None:
+        """Advance to ``end`` over a run of characters containing no newline."""
+        self.column += end - self.pos
+        self.pos = end
 
     def read_string(self, quote_char: str) -> str:
         """Read a quoted string with escape sequence handling."""
         result = ""
         self.advance()
+        plain_run_re = _STRING_RUN_RES[quote_char]
 
         while self.pos < len(self.text):
+            match = plain_run_re.match(self.text, self.pos)
+            if match:
+                result += match.group()
+                self._skip_run(match.end())
+                continue
+
             char = self.peek()
 
             if char == quote_char:
                 self.advance()
                 break
             if char == "\\":
+                escape_run = _UNICODE_ESCAPE_RUN_RE.match(self.text, self.pos)
+                if escape_run:
+                    result += _decode_unicode_escapes(escape_run.group())
+                    self._skip_run(escape_run.end())
+                    continue
+                # Any other escape, including an incomplete \u, is one character
                 self.advance()
                 next_char = self.peek()
-                if next_char == "u":
-                    saved_pos = self.pos
-                    unicode_result = self._read_unicode_escape()
-                    if unicode_result is not None:
-                        result += unicode_result
-                    else:
-                        self.pos = saved_pos
-                        result += self.advance()
-                elif next_char:
+                if next_char:
                     result += JSON_ESCAPE_MAP.get(next_char, next_char)
                     self.advance()
             else:
@@ -155,97 +189,18 @@ class Lexer:
             if char.isalnum() or char in "_$":
                 result += self.advance()
             elif char == "\\" and self.peek(1) == "u":
-                self.advance()
-                unicode_result = self._read_unicode_escape()
-                if unicode_result is not None:
-                    result += unicode_result
+                escape_run = _UNICODE_ESCAPE_RUN_RE.match(self.text, self.pos)
+                if escape_run:
+                    result += _decode_unicode_escapes(escape_run.group())
+                    self._skip_run(escape_run.end())
                 else:
-                    result += "u"
+                    # Incomplete escape: drop the backslash and keep the "u"
+                    self.advance()
+                    result += self.advance()
             else:
                 break
         return result
 
-    def _read_unicode_escape(self) -> Optional[str]:
-        """Read a Unicode escape sequence."""
-        if self.peek() != "u":
-            return None
-
-        self.advance()
-        hex_digits = self._read_hex_digits()
-        if hex_digits is None:
-            return None
-
-        try:
-            code_point = int(hex_digits, 16)
-            return self._process_unicode_code_point(code_point)
-        except (ValueError, OverflowError):
-            return None
-
-    def _read_hex_digits(self) -> Optional[str]:
-        """Read exactly 4 hexadecimal digits."""
-        hex_digits = ""
-        for _ in range(4):
-            char = self.peek()
-            if char and char in "0123456789abcdefABCDEF":
-                hex_digits += self.advance()
-            else:
-                return None
-        return hex_digits
-
-    def _process_unicode_code_point(self, code_point: int) -> str:
-        """Process a Unicode code point, handling surrogates."""
-        if 0xD800 <= code_point <= 0xDBFF:
-            return self._handle_high_surrogate(code_point)
-        if 0xDC00 <= code_point <= 0xDFFF:
-            return "\ufffd"  # Unicode replacement character
-        return chr(code_point)
-
-    def _handle_high_surrogate(self, code_point: int) -> str:
-        """Handle high surrogate pair."""
-        low_surrogate = self._read_low_surrogate()
-        if low_surrogate is not None:
-            high = code_point - 0xD800
-            low = low_surrogate - 0xDC00
-            combined = 0x10000 + (high << 10) + low
-            return chr(combined)
-        return "\ufffd"
-
-    def _read_low_surrogate(self) -> Optional[int]:
-        """Read the low surrogate pair for Unicode surrogates."""
-        saved_pos = self.pos
-        saved_line = self.line
-        saved_column = self.column
-
-        if self.peek() == "\\" and self.peek(1) == "u":
-            self.advance()
-            self.advance()
-
-            hex_digits = ""
-            for _ in range(4):
-                char = self.peek()
-                if char and char in "0123456789abcdefABCDEF":
-                    hex_digits += self.advance()
-                else:
-                    self.pos = saved_pos
-                    self.line = saved_line
-                    self.column = saved_column
-                    return None
-
-            try:
-                code_point = int(hex_digits, 16)
-                if 0xDC00 <= code_point <= 0xDFFF:
-                    return code_point
-                self.pos = saved_pos
-                self.line = saved_line
-                self.column = saved_column
-                return None
-            except ValueError:
-                self.pos = saved_pos
-                self.line = saved_line
-                self.column = saved_column
-                return None
-        return None
-
     def tokenize(self) -> Iterator[Token]:
         """Tokenize the input text into a sequence of tokens."""
         while self.pos < len(self.text):
@@ -257,23 +212,24 @@ class Lexer:
             char = self.peek()
             pos = self.current_position()
 
-            # Try different token types in order
-            token = self._try_newline_token(char, pos)
+            # Try different token types, most frequent in JSON first; the
+            # starting characters of each type do not overlap
+            token = self._try_structural_token(char, pos)
             if token:
                 yield token
                 continue
 
-            token = self._try_structural_token(char, pos)
+            token = self._try_string_token(char, pos)
             if token:
                 yield token
                 continue
 
-            token = self._try_string_token(char, pos)
+            token = self._try_number_token(char, pos)
             if token:
                 yield token
                 continue
 
-            token = self._try_number_token(char, pos)
+            token = self._try_newline_token(char, pos)
             if token:
                 yield token
                 continue
@@ -302,11 +258,9 @@ class Lexer:
 
     def _try_structural_token(self, char: str, pos: Position) -> Optional[Token]:
         """Try to create structural tokens (braces, brackets, etc.)."""
-        token_map = get_structural_token_map()
-
-        if char in token_map:
+        if char in _STRUCTURAL_TOKEN_MAP:
             self.advance()
-            return Token(token_map[char], char, pos)
+            return Token(_STRUCTURAL_TOKEN_MAP[char], char, pos)
         return None
 
     def _try_string_token(self, char: str, pos: Position) -> Optional[Token]:
@@ -343,12 +297,8 @@ class Lexer:
         """Try to create an identifier or keyword token."""
         if char.isalpha() or char == "_" or (char == "\\" and self.peek(1) == "u"):
             identifier = self.read_identifier()
-
-            if identifier in {"true", "false"}:
-                return Token(TokenType.BOOLEAN, identifier, pos)
-            if identifier == "null":
-                return Token(TokenType.NULL, identifier, pos)
-            return Token(TokenType.IDENTIFIER, identifier, pos)
+            token_type = _KEYWORD_TOKEN_TYPES.get(identifier, TokenType.IDENTIFIER)
+            return Token(token_type, identifier, pos)
         return None
 
     def get_all_tokens(self) -> list[Token]:
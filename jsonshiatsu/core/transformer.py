@@ -5,6 +5,8 @@ This module provides backward compatibility for the original JSONPreprocessor
 while delegating to the new modular preprocessing pipeline.
 """
 
+import dataclasses
+import functools
 import re
 import warnings
 from typing import Any, Optional
@@ -14,10 +16,41 @@ from ..preprocessing.extractors import ContentExtractor, MarkdownExtractor
 from ..preprocessing.handlers import CommentHandler, JavaScriptHandler
 from ..preprocessing.normalizers import QuoteNormalizer, WhitespaceNormalizer
 from ..preprocessing.repairers import StringRepairer, StructureFixer
-from ..utils.config import PreprocessingConfig
+from ..utils.config import (
+    ExtractionSettings,
+    NormalizationSettings,
+    PreprocessingConfig,
+    RepairSettings,
+)
 from .array_object_handler import ArrayObjectHandler
 from .string_preprocessors import StringPreprocessor
 
+# Common streaming prefixes stripped by handle_streaming_responses
+_STREAMING_PREFIX_PATTERNS = [
+    re.compile(r"^data:\s*", re.MULTILINE),  # Server-sent events
+    re.compile(r"^\d+\s*\n", re.MULTILINE),  # Chunked transfer encoding sizes
+]
+
+
+# Preprocessing steps are stateless, so one default pipeline can be shared
+_DEFAULT_PIPELINE = PreprocessingPipeline.create_default_pipeline()
+
+# Only short documents are memoized; long ones are rarely repeated and would
+# keep large inputs and outputs alive in the cache
+_PREPROCESS_CACHE_MAX_LENGTH = 512
+
+
+@functools.lru_cache(maxsize=256)
+def _preprocess_cached(text: str, settings: tuple[tuple[bool, ...], ...]) -> str:
+    """Run the default pipeline, memoized on the text and config settings."""
+    extraction, normalization, repair = settings
+    config = PreprocessingConfig(
+        extraction=ExtractionSettings(*extraction),
+        normalization=NormalizationSettings(*normalization),
+        repair=RepairSettings(*repair),
+    )
+    return _DEFAULT_PIPELINE.process(text, config)
+
 
 class JSONPreprocessor:
     """
@@ -53,6 +86,14 @@ class JSONPreprocessor:
                 else PreprocessingConfig.conservative()
             )
 
+        # The result is an immutable str, so repeated inputs can share it
+        if (
+            cls is JSONPreprocessor
+            and type(config) is PreprocessingConfig
+            and len(text) <= _PREPROCESS_CACHE_MAX_LENGTH
+        ):
+            return _preprocess_cached(text, dataclasses.astuple(config))
+
         # Create processor and apply pipeline
         processor = cls()
         return processor.pipeline.process(text, config)
@@ -147,14 +188,9 @@ class JSONPreprocessor:
         # Basic streaming response handling - could be moved to a separate handler
 
         # Remove common streaming prefixes
-        streaming_patterns = [
-            r"^data:\s*",  # Server-sent events
-            r"^\d+\s*\n",  # Chunked transfer encoding sizes
-        ]
-
         result = text
-        for pattern in streaming_patterns:
-            result = re.sub(pattern, "", result, flags=re.MULTILINE)
+        for pattern in _STREAMING_PREFIX_PATTERNS:
+            result = pattern.sub("", result)
 
         return result.strip()
 
@@ -20,7 +20,8 @@ class MarkdownExtractor(PreprocessingStepBase):
 
     def process(self, text: str, config: PreprocessingConfig) -> str:
         """Extract JSON from markdown code blocks."""
-        if not config.extract_from_markdown:
+        # Both fenced and inline code blocks need a backtick
+        if not config.extract_from_markdown or "`" not in text:
             return text
         return self._extract_from_code_blocks(text)
 
@@ -11,6 +11,9 @@ from ..utils.config import PreprocessingConfig
 from .base import PreprocessingStepBase
 from .string_utils import find_string_end_simple
 
+# Characters that may start a string literal or a comment
+_COMMENT_OR_QUOTE_RE = re.compile(r"[\"'/]")
+
 
 class CommentHandler(PreprocessingStepBase):
     """Removes comments from JSON text."""
@@ -21,69 +24,61 @@ class CommentHandler(PreprocessingStepBase):
 
     def process(self, text: str, config: PreprocessingConfig) -> str:
         """Remove comments from JSON text."""
-        if not config.remove_comments:
+        # Every comment starts with "/", so skip the character scan without one
+        if not config.remove_comments or "/" not in text:
             return text
         return self._remove_comments(text)
 
     @staticmethod
     def _remove_comments(text: str) -> str:
         """Remove single-line and multi-line comments from JSON."""
-        # Use a simple approach for comment removal since it needs access to result list
-        result = []
-        i = 0
-        in_string = False
-        string_char = None
-
-        while i < len(text):
+        # Copy the text between comments as whole slices; only quotes and
+        # slashes need a closer look
+        result: list[str] = []
+        start = pos = 0
+        length = len(text)
+
+        while True:
+            match = _COMMENT_OR_QUOTE_RE.search(text, pos)
+            if match is None:
+                break
+            i = match.start()
             char = text[i]
-            next_char = text[i + 1] if i + 1 < len(text) else ""
 
-            # Handle string state
-            if not in_string and char in ['"', "'"]:
-                in_string = True
-                string_char = char
-                result.append(char)
-                i += 1
-                continue
-            if in_string and char == string_char and (i == 0 or text[i - 1] != "\\"):
-                in_string = False
-                string_char = None
-                result.append(char)
-                i += 1
+            if char in "\"'":
+                # Skip the string; a quote preceded by a backslash does not end it
+                end = text.find(char, i + 1)
+                while end != -1 and text[end - 1] == "\\":
+                    end = text.find(char, end + 1)
+                if end == -1:
+                    break
+                pos = end + 1
                 continue
-            if in_string:
-                result.append(char)
-                i += 1
+
+            next_char = text[i + 1 : i + 2]
+            if next_char not in ("/", "*"):
+                pos = i + 1
                 continue
+            if i > start:
+                result.append(text[start:i])
 
-            # Handle comments when not in strings
-            if char == "/" and next_char == "/":
-                # Single-line comment - skip to end of line
-                while i < len(text) and text[i] != "\n":
-                    i += 1
-                # Keep the newline
-                if i < len(text):
-                    result.append(text[i])
-                    i += 1
-            elif char == "/" and next_char == "*":
-                # Multi-line comment - skip to */
-                i += 2
-                while i < len(text) - 1:
-                    if text[i] == "*" and text[i + 1] == "/":
-                        i += 2
-                        break
-                    i += 1
-                # Only add a space if there isn't already whitespace before or after
-                has_space_before = result and result[-1].isspace()
-                has_space_after = i < len(text) and text[i].isspace()
-
-                if not has_space_before and not has_space_after:
-                    result.append(" ")
-                # If there's space before but not after, or vice versa, don't add extra space
-            else:
-                result.append(char)
-                i += 1
+            if next_char == "/":
+                # Single-line comment - skip to end of line, keeping the newline
+                end = text.find("\n", i)
+                start = pos = length if end == -1 else end
+                continue
 
+            # Multi-line comment - skip to */ (an unterminated one stops short
+            # of the last character, which is kept)
+            end = text.find("*/", i + 2)
+            start = pos = max(i + 2, length - 1) if end == -1 else end + 2
+            # Only add a space if there isn't already whitespace before or after
+            has_space_before = result and result[-1][-1].isspace()
+            has_space_after = pos < length and text[pos].isspace()
+            if not has_space_before and not has_space_after:
+                result.append(" ")
+
+        result.append(text[start:])
         return "".join(result)
 
 
@@ -106,22 +101,26 @@ class JavaScriptHandler(PreprocessingStepBase):
     @staticmethod
     def _remove_function_definitions(text: str) -> str:
         """Remove JavaScript function definitions."""
-        # Handle function keyword
+        # Jump between occurrences of the keyword, copying the text between
         result = []
         i = 0
+        start = text.find("function")
+
+        while start >= 0:
+            end = start
+            if JavaScriptHandler._is_function_keyword(text, start):
+                end = JavaScriptHandler._skip_function_definition(text, start)
+            if end > start:
+                result.append(text[i:start])
+                result.append("null")
+                i = end
+                start = text.find("function", end)
+            else:
+                start = text.find("function", start + 1)
 
-        while i < len(text):
-            if JavaScriptHandler._is_function_keyword(text, i):
-                # Skip function definition
-                j = JavaScriptHandler._skip_function_definition(text, i)
-                if j > i:
-                    result.append("null")
-                    i = j
-                    continue
-
-            result.append(text[i])
-            i += 1
-
+        if not result:
+            return text
+        result.append(text[i:])
         return "".join(result)
 
     @staticmethod
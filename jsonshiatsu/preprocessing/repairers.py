@@ -13,6 +13,22 @@ from ..utils.config import PreprocessingConfig
 from .base import PreprocessingStepBase
 from .string_utils import find_string_end_simple
 
+# Non-standard boolean and null literals, matched in a single pass.
+# NaN and Infinity are handled by JavaScriptHandler, not here.
+_BOOLEAN_NULL_RE = re.compile(
+    r"\b(?:True|False|None|undefined|UNDEFINED|Undefined|NULL|Null"
+    r"|[Yy][Ee][Ss]|[Nn][Oo])\b"
+)
+_BOOLEAN_NULL_REPLACEMENTS = {
+    "true": "true",
+    "false": "false",
+    "none": "null",
+    "undefined": "null",
+    "null": "null",
+    "yes": "true",
+    "no": "false",
+}
+
 
 class StructureFixer(PreprocessingStepBase):
     """Fixes structural issues in JSON text."""
@@ -518,27 +534,6 @@ class StringRepairer(PreprocessingStepBase):
     @staticmethod
     def normalize_boolean_null(text: str) -> str:
         """Normalize boolean and null values to JSON standard."""
-        # Comprehensive boolean and null value replacements
-        replacements = [
-            # Python-style
-            (r"\bTrue\b", "true"),
-            (r"\bFalse\b", "false"),
-            (r"\bNone\b", "null"),
-            # JavaScript/generic (case-insensitive)
-            (r"\bundefined\b", "null"),
-            (r"\bUNDEFINED\b", "null"),
-            (r"\bUndefined\b", "null"),
-            # NULL variants
-            (r"\bNULL\b", "null"),
-            (r"\bNull\b", "null"),
-            # Yes/No variants (case insensitive)
-            (r"\b[Yy][Ee][Ss]\b", "true"),
-            (r"\b[Nn][Oo]\b", "false"),
-            # Note: NaN and Infinity are handled by JavaScriptHandler, not here
-        ]
-
-        result = text
-        for pattern, replacement in replacements:
-            result = re.sub(pattern, replacement, result)
-
-        return result
+        return _BOOLEAN_NULL_RE.sub(
+            lambda match: _BOOLEAN_NULL_REPLACEMENTS[match.group(0).lower()], text
+        )
@@ -3,7 +3,7 @@ Security limits and validation for jsonshiatsu.
 This module provides security validation to prevent resource exhaustion attacks.
 """
 
-from typing import Optional
+from typing import Any, Optional
 
 from ..utils.config import ParseLimits
 from .exceptions import SecurityError
@@ -85,6 +85,23 @@ class LimitValidator:
                 f"{self.limits.max_total_items}"
             )
 
+    def validate_value(self, value: Any) -> None:
+        """Validate an already-parsed value against string and structure limits."""
+        if isinstance(value, str):
+            self.validate_string_length(value)
+        elif isinstance(value, dict):
+            self.enter_structure()
+            self.validate_object_keys(len(value))
+            for item in value.values():
+                self.validate_value(item)
+            self.exit_structure()
+        elif isinstance(value, list):
+            self.enter_structure()
+            self.validate_array_items(len(value))
+            for item in value:
+                self.validate_value(item)
+            self.exit_structure()
+
     def reset(self) -> None:
         """Reset validator state for reuse."""
         self.nesting_depth = 0
@@ -182,6 +182,26 @@ class TestLoadsCompatibility(unittest.TestCase):
             # May raise TypeError for unknown params, that's acceptable
             pass
 
+    def test_binary_input(self):
+        """Test bytes-like input is decoded like json.loads does."""
+        text = '{"name": "Jürgen", "items": [1, 2]}'
+        test_cases = [
+            text.encode("utf-8"),
+            text.encode("utf-8-sig"),
+            text.encode("utf-16"),
+            text.encode("utf-32"),
+            bytearray(text.encode("utf-8")),
+            memoryview(text.encode("utf-8")),
+        ]
+
+        for test_case in test_cases:
+            with self.subTest(test_case=test_case):
+                self.assertEqual(jsonshiatsu.loads(test_case), json.loads(text))
+
+        # Malformed input should still be repaired after decoding
+        result = jsonshiatsu.loads(b"{name: 'Jost', 'tags': ['a', 'b',]}")
+        self.assertEqual(result, {"name": "Jost", "tags": ["a", "b"]})
+
 
 class TestLoadCompatibility(unittest.TestCase):
     """Test load() function compatibility with json.load()."""
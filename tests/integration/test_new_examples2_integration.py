@@ -10,6 +10,14 @@ import pytest
 import jsonshiatsu as json
 
 
+def assert_subset(actual: dict, expected_subset: dict) -> None:
+    """Assert that actual contains every key of expected_subset with equal values."""
+    missing = expected_subset.keys() - actual.keys()
+    assert not missing, f"Missing keys: {missing}"
+    for key, value in expected_subset.items():
+        assert actual[key] == value, f"{key}: expected {value!r}, got {actual[key]!r}"
+
+
 class TestNewExamples2Integration:
     """Integration tests for the 10 new malformed JSON examples."""
 
@@ -173,12 +181,10 @@ class TestNewExamples2Integration:
                 }"""
         result = json.loads(malformed)
 
-        # Verify structure (exact escape handling may vary)
-        assert "message" in result
-        assert "path" in result
-        assert "unicode" in result
-        assert "empty" in result
-        assert result["empty"] is None  # Empty value should become null
+        # Empty value should become null; exact escape handling may vary
+        assert_subset(result, {"empty": None})
+        for key in ("message", "path", "unicode"):
+            assert isinstance(result.get(key), str), f"{key}: {result.get(key)!r}"
 
     def test_example_8_javascript_constructs(self) -> None:
         """Test Example 8: JavaScript constructs."""
@@ -222,14 +228,12 @@ class TestNewExamples2Integration:
                 }"""
         result = json.loads(malformed)
 
-        # Verify structure
-        assert "settings" in result
-        assert "data" in result
-        assert "timestamp" in result
-
-        # Check specific fixes
-        assert result["settings"]["notifications"]["sms"] is None  # Missing value
-        assert result["data"] == [1, 2, 3, 4, None, 6]  # Sparse array
+        # Check specific fixes: missing value and sparse array
+        assert_subset(result, {"data": [1, 2, 3, 4, None, 6]})
+        assert_subset(
+            result["settings"]["notifications"],
+            {"email": True, "push": False, "sms": None},
+        )
         assert isinstance(result["timestamp"], str)  # Unclosed string fixed
 
     def test_example_10_complex_template_literals(self) -> None:
@@ -11,6 +11,13 @@ import unittest
 
 import jsonshiatsu
 
+# Inputs that previously caused timeouts in preprocessing
+PROBLEMATIC_PATTERNS: tuple[str, ...] = (
+    r'{"text": "Line\\n• bullet"}',
+    r'{"text": "Mixed\\nand\\\\npatterns"}',
+    '{"reason": "Text with \\"nested\\" quotes"}',
+)
+
 
 class TestStringConcatenation(unittest.TestCase):
     """Test string concatenation patterns."""
@@ -180,14 +187,7 @@ class TestPerformanceAndStability(unittest.TestCase):
 
     def test_no_infinite_loops(self) -> None:
         """Ensure no infinite loops on problematic patterns."""
-        # These patterns previously caused timeouts
-        problematic_patterns = [
-            r'{"text": "Line\\n• bullet"}',
-            r'{"text": "Mixed\\nand\\\\npatterns"}',
-            '{"reason": "Text with \\"nested\\" quotes"}',
-        ]
-
-        for pattern in problematic_patterns:
+        for pattern in PROBLEMATIC_PATTERNS:
             with self.subTest(pattern=pattern):
                 try:
                     result = jsonshiatsu.loads(pattern)
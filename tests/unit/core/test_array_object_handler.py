@@ -21,7 +21,7 @@ class TestArrayObjectHandler(unittest.TestCase):
         """Test that function calls with parentheses are preserved."""
         input_text = 'function test() { return ("value"); }'
         result = ArrayObjectHandler.fix_structural_syntax(input_text)
-        self.assertEqual(result, input_text)  # Should remain unchanged
+        self.assertIs(result, input_text)  # Should remain unchanged
 
     def test_fix_structural_syntax_sets_to_arrays(self) -> None:
         """Test converting set literals to arrays."""
@@ -82,7 +82,7 @@ class TestArrayObjectHandler(unittest.TestCase):
         """Test that valid objects are not modified."""
         input_text = '{"key1": "value1", "key2": "value2"}'
         result = ArrayObjectHandler.handle_sparse_arrays(input_text)
-        self.assertEqual(result, input_text)
+        self.assertIs(result, input_text)
 
     def test_handle_sparse_arrays_mixed_object_array(self) -> None:
         """Test handling sparse arrays that contain objects."""
@@ -104,6 +104,12 @@ class TestArrayObjectHandler(unittest.TestCase):
         result = ArrayObjectHandler.handle_sparse_arrays(input_text)
         self.assertEqual(result, input_text)
 
+    def test_clean_input_returned_unchanged(self) -> None:
+        """Test that input without trigger characters skips processing."""
+        input_text = '["a", "b",\n "c"]'
+        self.assertIs(ArrayObjectHandler.fix_structural_syntax(input_text), input_text)
+        self.assertIs(ArrayObjectHandler.handle_sparse_arrays(input_text), input_text)
+
     def test_fix_unclosed_strings_basic_unclosed(self) -> None:
         """Test fixing basic unclosed strings."""
         input_text = '{"key": "value'
@@ -129,7 +135,7 @@ class TestArrayObjectHandler(unittest.TestCase):
         """Test that balanced quotes are left unchanged."""
         input_text = '{"key": "value", "other": "data"}'
         result = ArrayObjectHandler.fix_unclosed_strings(input_text)
-        self.assertEqual(result, input_text)
+        self.assertIs(result, input_text)
 
     def test_fix_unclosed_strings_escaped_quotes(self) -> None:
         """Test handling escaped quotes correctly."""
@@ -144,6 +150,12 @@ class TestArrayObjectHandler(unittest.TestCase):
         result = ArrayObjectHandler.fix_unclosed_strings(input_text)
         self.assertEqual(result, expected)
 
+    def test_fix_unclosed_strings_without_quotes(self) -> None:
+        """Test that text without double quotes is returned as is."""
+        input_text = "{key: 'value\n  other: [1, 2]}"
+        result = ArrayObjectHandler.fix_unclosed_strings(input_text)
+        self.assertIs(result, input_text)
+
     def test_integration_all_handlers(self) -> None:
         """Test integration of all array/object processing methods."""
         input_text = '("key": {1, 2, ,}, "array": [, "value"'
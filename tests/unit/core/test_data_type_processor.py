@@ -42,7 +42,14 @@ class TestDataTypeProcessor(unittest.TestCase):
         """Test that boolean normalization respects word boundaries."""
         input_text = '{"truename": "value", "falsehood": "test"}'
         result = DataTypeProcessor.normalize_boolean_null(input_text)
-        self.assertEqual(result, input_text)  # Should remain unchanged
+        self.assertIs(result, input_text)  # Should remain unchanged
+
+    def test_normalize_boolean_null_case_sensitive_keywords(self) -> None:
+        """Test that only yes/no/undefined are matched case-insensitively."""
+        input_text = '{"a": Null, "b": TRUE, "c": NONE, "d": yEs, "e": Undefined}'
+        expected = '{"a": Null, "b": TRUE, "c": NONE, "d": true, "e": null}'
+        result = DataTypeProcessor.normalize_boolean_null(input_text)
+        self.assertEqual(result, expected)
 
     def test_normalize_special_numbers_nan_infinity(self) -> None:
         """Test normalizing NaN and Infinity values."""
@@ -186,6 +193,51 @@ class TestDataTypeProcessor(unittest.TestCase):
         self.assertIn('"empty": null', result)  # Empty filled
         self.assertIn('"special": "NaN"', result)  # Special number handled
 
+    def test_glued_tokens_not_rescanned(self) -> None:
+        """Test that replaced text is not matched again within one pass."""
+        special = DataTypeProcessor.normalize_special_numbers
+        self.assertEqual(special("{017NaN1"), '{017"NaN"1')
+        self.assertEqual(special("InfinityNaN"), '"Infinity""NaN"')
+
+        extended = DataTypeProcessor.normalize_extended_numbers
+        self.assertEqual(extended("0b1010o7:[]"), "10o7:[]")
+        self.assertEqual(extended("0o70b101"), "56b101")
+
+    def test_all_processors_in_sequence(self) -> None:
+        """Test the output of the four passes applied in turn."""
+        cases = [
+            (
+                '{"active": True, "count": 0x10, "mode": 0755, "bin": 0b11, '
+                '"v": 1.2.3.4, "n": +5, "dot": 42. , "sci": 1e, "empty": , '
+                '"special": -Infinity, "quoted": "NaN", "arr": [1, , 2], '
+                '"last": }',
+                '{"active": true, "count": 16, "mode": 493, "bin": 3, '
+                '"v": "1.2.3.4", "n": 5, "dot": 42, "sci": 1e0, "empty": null, '
+                '"special": "-Infinity", "quoted": "NaN", "arr": [1, null, 2], '
+                '"last": null}',
+            ),
+            # Rewritten numbers followed by a trailing dot or bare exponent
+            ("[017., 2]", "[15, 2]"),
+            ('{"a": 0x1F.,}', '{"a": 31,}'),
+            ("[0x1F.]", "[31]"),
+            ('{"a": 0o17.}', '{"a": 15.}'),
+            ("[0b101. , 1]", "[5. , 1]"),
+            ("[0x1F.e]", "[31.e0]"),
+            ("[017.5e]", "[15.5e0]"),
+            # Rewritten numbers right before a delimiter
+            ("[0x1F,0b11]", "[31,3]"),
+            ('{"a": 0755}', '{"a": 493}'),
+            ('{"a": 0o17,"b": 0x10}', '{"a": 15,"b": 16}'),
+            ("[[017],{}]", "[[15],{}]"),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                result = DataTypeProcessor.normalize_boolean_null(text)
+                result = DataTypeProcessor.normalize_special_numbers(result)
+                result = DataTypeProcessor.normalize_extended_numbers(result)
+                result = DataTypeProcessor.handle_empty_values(result)
+                self.assertEqual(result, expected)
+
     def test_edge_cases_empty_input(self) -> None:
         """Test handling of empty input."""
         empty_input = ""
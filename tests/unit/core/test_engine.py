@@ -4,26 +4,37 @@ Test cases for the jsonshiatsu core engine functionality.
 Tests focus on parsing logic, not preprocessing (which is covered in transformer tests).
 """
 
+import json
 import unittest
+from functools import lru_cache
+from unittest import mock
 
 import jsonshiatsu
+from jsonshiatsu.core import engine
 from jsonshiatsu.core.engine import Lexer, Parser
-from jsonshiatsu.security.exceptions import ErrorReporter, ParseError
-from jsonshiatsu.utils.config import ParseConfig
+from jsonshiatsu.core.tokenizer import TokenType
+from jsonshiatsu.security.exceptions import ErrorReporter, ParseError, SecurityError
+from jsonshiatsu.utils.config import ParseConfig, ParseLimits
 
 
 class TestParserCore(unittest.TestCase):
     """Test core parser functionality with minimal preprocessing."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up with minimal preprocessing config for pure parsing tests."""
-        self.config = ParseConfig()
-        self.config.preprocessing_config = None  # Disable preprocessing for unit tests
+        cls.config = ParseConfig()
+        cls.config.preprocessing_config = None  # Disable preprocessing for unit tests
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _tokens_for(json_str):
+        """Tokenize each distinct input once across the test class."""
+        return tuple(Lexer(json_str).get_all_tokens())
 
     def _parse_tokens(self, json_str):
         """Helper to parse tokens directly for parser testing."""
-        lexer = Lexer(json_str)
-        tokens = lexer.get_all_tokens()
+        tokens = list(self._tokens_for(json_str))
         error_reporter = ErrorReporter(json_str)  # ErrorReporter needs text
         parser = Parser(tokens, self.config, error_reporter)
         return parser.parse()
@@ -63,6 +74,23 @@ class TestParserCore(unittest.TestCase):
         expected = {"obj": {"nested": "value"}, "arr": [1, {"inner": 2}]}
         self.assertEqual(result, expected)
 
+    def test_object_keys_are_interned(self):
+        """Test that short ASCII keys share one string object across parses."""
+        first = self._parse_tokens('[{"record_id": 1}, {record_id: 2}]')
+        second = self._parse_tokens('{"record_id": 3}')
+        keys = [next(iter(first[0])), next(iter(first[1])), next(iter(second))]
+        self.assertIs(keys[0], keys[1])
+        self.assertIs(keys[0], keys[2])
+
+    def test_parser_consumes_token_stream(self):
+        """Test that the parser pulls tokens lazily from a generator."""
+        parser = Parser(Lexer('\n{"a": [1, 2]}').tokenize(), self.config)
+        self.assertEqual(parser.peek_token(2).value, "a")
+        self.assertEqual(parser.current_token().type, TokenType.NEWLINE)
+        self.assertEqual(parser.parse(), {"a": [1, 2]})
+        self.assertEqual(parser.current_token().type, TokenType.EOF)
+        self.assertEqual(parser.advance().type, TokenType.EOF)
+
     def test_string_escape_handling(self):
         """Test proper handling of escaped strings."""
         result = self._parse_tokens('{"escaped": "line1\\nline2"}')
@@ -81,6 +109,10 @@ class TestParserCore(unittest.TestCase):
 class TestEngineIntegration(unittest.TestCase):
     """Test the full engine with preprocessing integration."""
 
+    def setUp(self):
+        """Start each test with an empty loads() result cache."""
+        engine._loads_cache.clear()
+
     def test_malformed_to_valid_conversion(self):
         """Test that malformed JSON gets converted to valid structures."""
         # Unquoted keys
@@ -121,6 +153,61 @@ class TestEngineIntegration(unittest.TestCase):
         expected = {"standard": "json", "array": [1, 2, 3], "nested": {"works": True}}
         self.assertEqual(result, expected)
 
+    def test_standard_json_string_content_preserved(self):
+        """Test that valid JSON skips preprocessing and keeps string content."""
+        valid_json = '{"answer": "no way", "emoji": "\\ud83d\\ude00", "x": 1.5}'
+        result = jsonshiatsu.loads(valid_json)
+        self.assertEqual(result, {"answer": "no way", "emoji": "😀", "x": 1.5})
+
+    def test_standard_json_with_urls_preserved(self):
+        """Test that URLs in valid JSON do not send it through preprocessing."""
+        result = jsonshiatsu.loads('{"u": "http://a", "v": "yes"}')
+        self.assertEqual(result, {"u": "http://a", "v": "yes"})
+        self.assertEqual(jsonshiatsu.loads('["x//y", "no"]'), ["x//y", "no"])
+
+    def test_repeated_loads_returns_independent_results(self):
+        """Test that cached loads() results cannot be mutated by callers."""
+        first = jsonshiatsu.loads("{test: [1, 2,]}")
+        first["test"].append(3)
+        second = jsonshiatsu.loads("{test: [1, 2,]}")
+        self.assertEqual(second, {"test": [1, 2]})
+
+        # Hooks and options are applied per call, not baked into the cache
+        self.assertEqual(jsonshiatsu.loads("{test: [1, 2,]}", object_hook=len), 1)
+        pairs = jsonshiatsu.loads('{"a": 1, "a": 2}', object_pairs_hook=list)
+        self.assertEqual(pairs, [("a", [1, 2])])
+        self.assertEqual(jsonshiatsu.loads('{"a": 1, "a": 2}'), {"a": 2})
+
+    def test_standard_json_loads_not_cached(self):
+        """Test that loads() only caches results that needed preprocessing."""
+        self.assertEqual(jsonshiatsu.loads('{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertEqual(len(engine._loads_cache), 0)
+
+        self.assertEqual(jsonshiatsu.loads("{a: [1, 2,]}"), {"a": [1, 2]})
+        self.assertEqual(len(engine._loads_cache), 1)
+
+    def test_loads_tries_standard_json_once(self):
+        """Test that a cache miss parses the original text as JSON only once."""
+        text = "{a: [1, 2,]}"
+        with mock.patch.object(engine.json, "loads", wraps=json.loads) as spy:
+            self.assertEqual(jsonshiatsu.loads(text), {"a": [1, 2]})
+        calls = [c for c in spy.call_args_list if c.args[0] == text]
+        self.assertEqual(len(calls), 1)
+
+    def test_standard_json_enforces_limits(self):
+        """Test that the standard JSON fast path still enforces security limits."""
+        config = ParseConfig(limits=ParseLimits(max_nesting_depth=2))
+        with self.assertRaises(SecurityError):
+            jsonshiatsu.parse('{"a": {"b": {"c": 1}}}', config=config)
+
+        config = ParseConfig(limits=ParseLimits(max_number_length=5))
+        with self.assertRaises(SecurityError):
+            jsonshiatsu.parse("[1234567]", config=config)
+
+        config = ParseConfig(limits=ParseLimits(max_array_items=2))
+        with self.assertRaises(SecurityError):
+            jsonshiatsu.parse("[1, 2, 3]", config=config)
+
 
 if __name__ == "__main__":
     unittest.main()
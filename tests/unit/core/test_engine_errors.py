@@ -4,6 +4,7 @@ Test cases for core engine error handling and edge cases.
 Tests focus on error paths, edge cases, and fallback mechanisms in the parsing engine.
 """
 
+import contextlib
 import json
 import unittest
 from io import StringIO
@@ -13,185 +14,172 @@ from jsonshiatsu.security.exceptions import ParseError, SecurityError
 from jsonshiatsu.utils.config import ParseConfig, ParseLimits
 
 
+PARSE_ERRORS = (ParseError, json.JSONDecodeError)
+
+ARRAY_ERROR_CASES = (
+    "[1, 2,",  # Unclosed array
+    "[1, 2 3]",  # Missing comma
+    "[1, , 3]",  # Empty element
+    "[1 2]",  # Missing comma between elements
+)
+OBJECT_ERROR_CASES = (
+    '{"key": "value"',  # Unclosed object
+    '{"key" "value"}',  # Missing colon
+    '{"key": "value",}',  # Trailing comma
+    '{key: "value"}',  # Unquoted key (should work with preprocessing)
+    '{"key": }',  # Missing value
+)
+STRING_ERROR_CASES = (
+    '{"key": "unclosed string}',  # Unclosed string
+    '{"key": "invalid\\escape"}',  # Invalid escape sequence
+    '{"key": "string with \n newline"}',  # Unescaped newline
+)
+NUMBER_ERROR_CASES = (
+    '{"num": 123.}',  # Trailing decimal
+    '{"num": .123}',  # Leading decimal (might be valid)
+    '{"num": 123.45.67}',  # Multiple decimals
+    '{"num": 123e}',  # Invalid exponent
+)
+NESTED_ERROR_CASES = (
+    '{"obj": {"nested": }',  # Missing value in nested object
+    '{"arr": [1, {"broken": }]}',  # Mixed structure errors
+    '{"deep": {"very": {"nested": {"error": }}}}',  # Deep nesting error
+)
+
+# Top-level scalars that must parse on their own (not inside objects/arrays)
+SINGLE_VALUES = (
+    ('"string"', "string"),
+    ("123", 123),
+    ("true", True),
+    ("false", False),
+    ("null", None),
+)
+
+# Inputs that exceed the limits configured in TestSecurityLimitValidation
+LARGE_INPUT = '{"key": "' + "x" * 200 + '"}'
+DEEP_INPUT = '{"a": {"b": {"c": {"d": {"e": "too_deep"}}}}}'
+LONG_STRING_INPUT = '{"key": "this_string_is_too_long_for_the_limit"}'
+LARGE_ARRAY_INPUT = "[1, 2, 3, 4, 5, 6, 7, 8, 9, 10]"
+LARGE_OBJECT_INPUT = '{"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}'
+
+# Words a useful error message is expected to contain at least one of
+ERROR_HINT_KEYWORDS = frozenset(
+    ("expected", "missing", "invalid", "could not", "error")
+)
+
+
+def _capture(json_text, errors=(*PARSE_ERRORS, ValueError)):
+    """Return (True, result) if loads() succeeds, else (False, error)."""
+    try:
+        return True, jsonshiatsu.loads(json_text)
+    except errors as error:
+        return False, error
+
+
 class TestParsingErrorPaths(unittest.TestCase):
     """Test error paths in the parsing engine."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test configuration."""
-        self.config = ParseConfig()
-        self.config.fallback = True  # Enable fallback for testing
-
-    def test_array_parsing_errors(self):
-        """Test error handling in array parsing."""
-        error_cases = [
-            "[1, 2,",  # Unclosed array
-            "[1, 2 3]",  # Missing comma
-            "[1, , 3]",  # Empty element
-            "[1 2]",  # Missing comma between elements
-        ]
+        cls.config = ParseConfig(fallback=True)  # Enable fallback for testing
 
-        for malformed_json in error_cases:
+    def _assert_recovers_or_raises(
+        self, cases, expected_type, errors=PARSE_ERRORS, allow_empty=False
+    ):
+        """Check each case either parses to expected_type or raises errors."""
+        for malformed_json in cases:
             with self.subTest(json=malformed_json):
                 try:
                     result = jsonshiatsu.loads(malformed_json)
-                    # If it succeeds, should be due to error recovery
-                    self.assertIsInstance(result, list)
-                except (ParseError, json.JSONDecodeError):
+                except errors:
                     # Expected to fail for some cases
-                    pass
+                    continue
+                # If it succeeds, should be due to preprocessing or recovery
+                if result or not allow_empty:
+                    self.assertIsInstance(result, expected_type)
+
+    def test_array_parsing_errors(self):
+        """Test error handling in array parsing."""
+        self._assert_recovers_or_raises(ARRAY_ERROR_CASES, list)
 
     def test_object_parsing_errors(self):
         """Test error handling in object parsing."""
-        error_cases = [
-            '{"key": "value"',  # Unclosed object
-            '{"key" "value"}',  # Missing colon
-            '{"key": "value",}',  # Trailing comma
-            '{key: "value"}',  # Unquoted key (should work with preprocessing)
-            '{"key": }',  # Missing value
-        ]
-
-        for malformed_json in error_cases:
-            with self.subTest(json=malformed_json):
-                try:
-                    result = jsonshiatsu.loads(malformed_json)
-                    # Some cases should succeed due to preprocessing
-                    self.assertIsInstance(result, dict)
-                except (ParseError, json.JSONDecodeError):
-                    # Expected to fail for some cases
-                    pass
+        self._assert_recovers_or_raises(OBJECT_ERROR_CASES, dict)
 
     def test_string_parsing_errors(self):
         """Test error handling in string parsing."""
-        error_cases = [
-            '{"key": "unclosed string}',  # Unclosed string
-            '{"key": "invalid\\escape"}',  # Invalid escape sequence
-            '{"key": "string with \n newline"}',  # Unescaped newline
-        ]
-
-        for malformed_json in error_cases:
-            with self.subTest(json=malformed_json):
-                try:
-                    result = jsonshiatsu.loads(malformed_json)
-                    # Some may succeed due to preprocessing
-                    self.assertIsInstance(result, dict)
-                except (ParseError, json.JSONDecodeError):
-                    # Expected to fail for some cases
-                    pass
+        self._assert_recovers_or_raises(STRING_ERROR_CASES, dict)
 
     def test_number_parsing_errors(self):
         """Test error handling in number parsing."""
-        error_cases = [
-            '{"num": 123.}',  # Trailing decimal
-            '{"num": .123}',  # Leading decimal (might be valid)
-            '{"num": 123.45.67}',  # Multiple decimals
-            '{"num": 123e}',  # Invalid exponent
-        ]
-
-        for malformed_json in error_cases:
-            with self.subTest(json=malformed_json):
-                try:
-                    result = jsonshiatsu.loads(malformed_json)
-                    if result:
-                        self.assertIsInstance(result, dict)
-                except (ParseError, json.JSONDecodeError, ValueError):
-                    # Expected to fail for malformed numbers
-                    pass
+        self._assert_recovers_or_raises(
+            NUMBER_ERROR_CASES,
+            dict,
+            errors=(*PARSE_ERRORS, ValueError),
+            allow_empty=True,
+        )
 
     def test_nested_structure_errors(self):
         """Test error handling in nested structures."""
-        error_cases = [
-            '{"obj": {"nested": }',  # Missing value in nested object
-            '{"arr": [1, {"broken": }]}',  # Mixed structure errors
-            '{"deep": {"very": {"nested": {"error": }}}}',  # Deep nesting error
-        ]
-
-        for malformed_json in error_cases:
-            with self.subTest(json=malformed_json):
-                try:
-                    result = jsonshiatsu.loads(malformed_json)
-                    if result:
-                        self.assertIsInstance(result, dict)
-                except (ParseError, json.JSONDecodeError):
-                    # Expected to fail for complex nested errors
-                    pass
+        self._assert_recovers_or_raises(NESTED_ERROR_CASES, dict, allow_empty=True)
 
 
 class TestSecurityLimitValidation(unittest.TestCase):
     """Test security limit enforcement in parsing."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build each limited configuration once for the class."""
+        cls.size_config = ParseConfig(limits=ParseLimits(max_input_size=100))
+        cls.nesting_config = ParseConfig(limits=ParseLimits(max_nesting_depth=3))
+        cls.string_config = ParseConfig(limits=ParseLimits(max_string_length=10))
+        cls.array_config = ParseConfig(limits=ParseLimits(max_array_items=5))
+        cls.object_config = ParseConfig(limits=ParseLimits(max_object_keys=3))
+
     def test_input_size_limit_enforcement(self):
         """Test input size limit enforcement."""
-        # Create config with small limit
-        limits = ParseLimits(max_input_size=100)
-        config = ParseConfig(limits=limits)
-
-        # Create large input that exceeds limit
-        large_input = '{"key": "' + "x" * 200 + '"}'
-
         with self.assertRaises((SecurityError, json.JSONDecodeError)):
-            jsonshiatsu.loads(large_input, config=config)
+            jsonshiatsu.loads(LARGE_INPUT, config=self.size_config)
 
     def test_nesting_depth_limit_enforcement(self):
         """Test nesting depth limit enforcement."""
-        # Create config with small nesting limit
-        limits = ParseLimits(max_nesting_depth=3)
-        config = ParseConfig(limits=limits)
-
-        # Create deeply nested JSON
-        deep_json = '{"a": {"b": {"c": {"d": {"e": "too_deep"}}}}}'
-
         with self.assertRaises((SecurityError, json.JSONDecodeError)):
-            jsonshiatsu.loads(deep_json, config=config)
+            jsonshiatsu.loads(DEEP_INPUT, config=self.nesting_config)
 
     def test_string_length_limit_enforcement(self):
         """Test string length limit enforcement."""
-        # Create config with small string limit
-        limits = ParseLimits(max_string_length=10)
-        config = ParseConfig(limits=limits)
-
-        # Create JSON with long string
-        long_string_json = '{"key": "this_string_is_too_long_for_the_limit"}'
-
         with self.assertRaises((SecurityError, json.JSONDecodeError)):
-            jsonshiatsu.loads(long_string_json, config=config)
+            jsonshiatsu.loads(LONG_STRING_INPUT, config=self.string_config)
 
     def test_array_items_limit_enforcement(self):
         """Test array items limit enforcement."""
-        # Create config with small array limit
-        limits = ParseLimits(max_array_items=5)
-        config = ParseConfig(limits=limits)
-
-        # Create array with too many items
-        large_array_json = "[1, 2, 3, 4, 5, 6, 7, 8, 9, 10]"
-
         with self.assertRaises((SecurityError, json.JSONDecodeError)):
-            jsonshiatsu.loads(large_array_json, config=config)
+            jsonshiatsu.loads(LARGE_ARRAY_INPUT, config=self.array_config)
 
     def test_object_items_limit_enforcement(self):
         """Test object items limit enforcement."""
-        # Create config with small object limit
-        limits = ParseLimits(max_object_keys=3)
-        config = ParseConfig(limits=limits)
-
-        # Create object with too many items
-        large_object_json = '{"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}'
-
         with self.assertRaises((SecurityError, json.JSONDecodeError)):
-            jsonshiatsu.loads(large_object_json, config=config)
+            jsonshiatsu.loads(LARGE_OBJECT_INPUT, config=self.object_config)
 
 
 class TestFallbackMechanisms(unittest.TestCase):
     """Test fallback mechanisms in the parsing engine."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one configuration per fallback setting."""
+        cls.fallback_config = ParseConfig(fallback=True)
+        cls.no_fallback_config = ParseConfig(fallback=False)
+
     def test_fallback_to_standard_json(self):
         """Test fallback to standard JSON parser."""
         # Valid JSON should work with fallback
         valid_json = '{"key": "value", "number": 123}'
+        result = jsonshiatsu.loads(valid_json, config=self.fallback_config)
 
-        config = ParseConfig(fallback=True)
-        result = jsonshiatsu.loads(valid_json, config=config)
-
-        self.assertEqual(result, {"key": "value", "number": 123})
+        # Must agree with the standard library on valid input
+        self.assertEqual(result, json.loads(valid_json))
 
     def test_fallback_disabled(self):
         """Test behavior when fallback is disabled."""
@@ -199,10 +187,8 @@ class TestFallbackMechanisms(unittest.TestCase):
         # The fallback setting controls whether to fall back to standard JSON parser
         malformed_json = "completely invalid non-json text"
 
-        config = ParseConfig(fallback=False)
-
         try:
-            result = jsonshiatsu.loads(malformed_json, config=config)
+            result = jsonshiatsu.loads(malformed_json, config=self.no_fallback_config)
             # The library's preprocessing is very robust
             self.assertIsNotNone(result)
         except (ParseError, json.JSONDecodeError, ValueError):
@@ -222,10 +208,8 @@ class TestFallbackMechanisms(unittest.TestCase):
         ```
         """
 
-        config = ParseConfig(fallback=True)
-
         try:
-            result = jsonshiatsu.loads(complex_malformed, config=config)
+            result = jsonshiatsu.loads(complex_malformed, config=self.fallback_config)
             # Should succeed due to preprocessing + fallback
             self.assertIsInstance(result, dict)
             self.assertIn("status", result)
@@ -238,10 +222,8 @@ class TestFallbackMechanisms(unittest.TestCase):
         # Truly malformed JSON that can't be recovered
         impossible_json = '{"key": "value" "another": "value"}'  # Missing comma
 
-        config = ParseConfig(fallback=True)
-
         try:
-            result = jsonshiatsu.loads(impossible_json, config=config)
+            result = jsonshiatsu.loads(impossible_json, config=self.fallback_config)
             # If preprocessing succeeds, that's also valid behavior
             self.assertIsInstance(result, dict)
         except json.JSONDecodeError as e:
@@ -259,7 +241,7 @@ class TestLoadFunction(unittest.TestCase):
 
         result = jsonshiatsu.load(json_file)
 
-        self.assertEqual(result, {"key": "value", "number": 42})
+        self.assertDictEqual(result, {"key": "value", "number": 42})
 
     def test_load_malformed_from_stringio(self):
         """Test loading malformed JSON from StringIO."""
@@ -269,7 +251,7 @@ class TestLoadFunction(unittest.TestCase):
         result = jsonshiatsu.load(json_file)
 
         # Should succeed due to preprocessing
-        self.assertEqual(result, {"key": "value", "number": 42})
+        self.assertDictEqual(result, {"key": "value", "number": 42})
 
     def test_load_with_config(self):
         """Test load() with custom configuration."""
@@ -288,14 +270,9 @@ class TestLoadFunction(unittest.TestCase):
         invalid_content = "not json at all"
         json_file = StringIO(invalid_content)
 
-        try:
-            # Test that truly invalid content may fail
+        # Truly invalid content may fail; if it somehow succeeds, that's fine too
+        with contextlib.suppress(ParseError, json.JSONDecodeError, ValueError):
             jsonshiatsu.load(json_file)
-            # If it somehow succeeds, that's also acceptable
-            pass
-        except (ParseError, json.JSONDecodeError, ValueError):
-            # Expected to fail for truly invalid content
-            pass
 
 
 class TestErrorReporting(unittest.TestCase):
@@ -303,43 +280,33 @@ class TestErrorReporting(unittest.TestCase):
 
     def test_position_accuracy(self):
         """Test that error positions are accurately reported."""
-        malformed_json = '{\n  "key": "value",\n  "error": here\n}'
+        ok, outcome = _capture('{\n  "key": "value",\n  "error": here\n}')
 
-        try:
-            result = jsonshiatsu.loads(malformed_json)
+        if ok:
             # If it parses successfully, that shows the robustness of preprocessing
-            self.assertIsNotNone(result)
-        except (ParseError, json.JSONDecodeError, ValueError) as error:
+            self.assertIsNotNone(outcome)
+        else:
             # If it fails, check for position information
-            if hasattr(error, "lineno"):
-                self.assertGreater(error.lineno, 0)
-            if hasattr(error, "colno"):
-                self.assertGreater(error.colno, 0)
+            if hasattr(outcome, "lineno"):
+                self.assertGreater(outcome.lineno, 0)
+            if hasattr(outcome, "colno"):
+                self.assertGreater(outcome.colno, 0)
 
     def test_error_context_provision(self):
         """Test that error context is provided."""
-        malformed_json = '{"key": "value", "broken": }'
+        ok, outcome = _capture('{"key": "value", "broken": }')
 
-        try:
-            result = jsonshiatsu.loads(malformed_json)
+        if ok:
             # If it parses successfully, that shows the robustness of preprocessing
-            self.assertIsNotNone(result)
-        except (ParseError, json.JSONDecodeError, ValueError) as e:
+            self.assertIsNotNone(outcome)
+        else:
             # If it fails, check that we get useful error information
-            error_message = str(e)
+            error_message = str(outcome)
             self.assertGreater(len(error_message), 0)
             # May contain suggestions or context
+            lowered_message = error_message.lower()
             self.assertTrue(
-                any(
-                    keyword in error_message.lower()
-                    for keyword in [
-                        "expected",
-                        "missing",
-                        "invalid",
-                        "could not",
-                        "error",
-                    ]
-                )
+                any(keyword in lowered_message for keyword in ERROR_HINT_KEYWORDS)
             )
 
     def test_suggestion_quality(self):
@@ -350,14 +317,12 @@ class TestErrorReporting(unittest.TestCase):
             "[1, 2, 3",  # Missing closing bracket
         ]
 
-        for malformed_json in common_errors:
-            with self.subTest(json=malformed_json):
-                try:
-                    jsonshiatsu.loads(malformed_json)
-                except (ParseError, json.JSONDecodeError) as e:
-                    error_message = str(e)
+        for text in common_errors:
+            with self.subTest(json=text):
+                ok, outcome = _capture(text, PARSE_ERRORS)
+                if not ok:
                     # Should provide actionable suggestions
-                    self.assertGreater(len(error_message), 0)
+                    self.assertTrue(str(outcome))
 
 
 class TestEdgeCases(unittest.TestCase):
@@ -375,19 +340,8 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_single_value_parsing(self):
         """Test parsing of single values (not objects/arrays)."""
-        # These should work
-        test_cases = [
-            ('"string"', "string"),
-            ("123", 123),
-            ("true", True),
-            ("false", False),
-            ("null", None),
-        ]
-
-        for input_json, expected in test_cases:
-            with self.subTest(json=input_json):
-                result = jsonshiatsu.loads(input_json)
-                self.assertEqual(result, expected)
+        results = tuple(jsonshiatsu.loads(json_text) for json_text, _ in SINGLE_VALUES)
+        self.assertEqual(results, tuple(expected for _, expected in SINGLE_VALUES))
 
     def test_unicode_handling(self):
         """Test handling of Unicode content."""
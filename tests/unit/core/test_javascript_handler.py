@@ -39,6 +39,17 @@ class TestJavaScriptHandler(unittest.TestCase):
         result = JavaScriptHandler.remove_comments(input_text)
         self.assertEqual(result, expected)
 
+    def test_remove_comments_unterminated_and_mixed(self) -> None:
+        """Test unterminated block comments and line comments after URLs."""
+        input_text = '{"a": 1, /* x */ "u": "http://h/p"} // c\n/* open /* open'
+        expected = '{"a": 1,  "u": "http://h/p"} \n/* open /* open'
+        result = JavaScriptHandler.remove_comments(input_text)
+        self.assertEqual(result, expected)
+
+        # Many unterminated openers are scanned once, not once per opener
+        input_text = "/* " * 5000
+        self.assertIs(JavaScriptHandler.remove_comments(input_text), input_text)
+
     def test_unwrap_function_calls_simple_function(self) -> None:
         """Test unwrapping simple function calls."""
         input_text = 'parseJSON({"key": "value"})'
@@ -144,6 +155,13 @@ class TestJavaScriptHandler(unittest.TestCase):
         result = JavaScriptHandler.evaluate_javascript_expressions(input_text)
         self.assertEqual(result, expected)
 
+    def test_evaluate_javascript_expressions_mixed_operators(self) -> None:
+        """Test that && combinations fold before || and lone minus signs survive."""
+        input_text = '{"r": true || false && false, "d": 9/3, "n": -1}'
+        expected = '{"r": true, "d": 3, "n": -1}'
+        result = JavaScriptHandler.evaluate_javascript_expressions(input_text)
+        self.assertEqual(result, expected)
+
     def test_evaluate_javascript_expressions_unsafe_increment(self) -> None:
         """Test that unsafe increment expressions are converted to null."""
         input_text = '{"counter": counter++}'
@@ -165,6 +183,13 @@ class TestJavaScriptHandler(unittest.TestCase):
         result = JavaScriptHandler.handle_javascript_constructs(input_text)
         self.assertEqual(result, expected)
 
+    def test_handle_javascript_constructs_function_keyword_boundary(self) -> None:
+        """Test that only a standalone function keyword starts a definition."""
+        input_text = '{"f": function(a) { return a; }, "g": "xfunction"}'
+        expected = '{"f": null, "g": "xfunction"}'
+        result = JavaScriptHandler.handle_javascript_constructs(input_text)
+        self.assertEqual(result, expected)
+
     def test_handle_javascript_constructs_regex_literals(self) -> None:
         """Test converting regex literals to strings."""
         input_text = '{"pattern": /test[a-z]+/gi}'
@@ -257,6 +282,36 @@ class TestJavaScriptHandler(unittest.TestCase):
         result = JavaScriptHandler.handle_javascript_constructs(input_text)
         self.assertEqual(result, expected)
 
+    def test_clean_input_returned_unchanged(self) -> None:
+        """Test that input without any trigger is returned as the same object."""
+        input_text = '{"valid": "json", "number": 123, "boolean": true}'
+        for method in (
+            JavaScriptHandler.remove_comments,
+            JavaScriptHandler.unwrap_function_calls,
+            JavaScriptHandler.unwrap_inline_function_calls,
+            JavaScriptHandler.evaluate_javascript_expressions,
+            JavaScriptHandler.handle_javascript_constructs,
+        ):
+            with self.subTest(method=method.__name__):
+                self.assertIs(method(input_text), input_text)
+
+    def test_standard_json_with_javascript_in_strings_unchanged(self) -> None:
+        """Test that strict JSON is not rewritten even if strings look like JS."""
+        input_text = (
+            '{"url": "ftp://h/p", "expr": "5>3 && x++", "when": "Date(today)", '
+            '"fn": "function f() {}", "calc": ": 1 + 2,"}'
+        )
+        result = JavaScriptHandler.remove_comments(input_text)
+        result = JavaScriptHandler.unwrap_function_calls(result)
+        result = JavaScriptHandler.unwrap_inline_function_calls(result)
+        result = JavaScriptHandler.evaluate_javascript_expressions(result)
+        result = JavaScriptHandler.handle_javascript_constructs(result)
+        self.assertEqual(result, input_text)
+
+        # NaN is not strict JSON, so the handlers still run
+        result = JavaScriptHandler.evaluate_javascript_expressions("[NaN, 9/3]")
+        self.assertEqual(result, "[NaN, 3]")
+
     def test_preserve_valid_json(self) -> None:
         """Test that valid JSON is preserved through all processing."""
         input_text = '{"valid": "json", "number": 123, "boolean": true}'
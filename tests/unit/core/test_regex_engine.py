@@ -13,21 +13,25 @@ Tests cover:
 # Try to import regex module
 import importlib.util
 import re
-import threading
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+from jsonshiatsu.core import regex_engine
 from jsonshiatsu.core.regex_engine import (
     BackendPriority,
     PatternCache,
     RegexConfig,
     RegexEngine,
+    RegexMetrics,
     RegexTimeoutError,
     SignalBackend,
     StdlibBackend,
     TimeoutBehavior,
     get_engine,
+    is_linear_pattern,
     reset_engine,
 )
 
@@ -68,6 +72,13 @@ def engine_strict():
     return RegexEngine(config)
 
 
+@pytest.fixture(scope="module")
+def pool():
+    """Worker threads shared by the thread safety tests."""
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        yield executor
+
+
 @pytest.fixture(autouse=True)
 def cleanup_global_engine():
     """Reset global engine after each test."""
@@ -276,6 +287,38 @@ class TestPatternCaching:
         assert cache.get("b", 0, "test") is None  # Evicted
         assert cache.get("c", 0, "test") is p3
 
+    def test_cache_put_existing_key(self):
+        """Test that re-adding a cached key replaces it without evicting."""
+        cache = PatternCache(maxsize=2)
+
+        p1 = re.compile(r"a")
+        p2 = re.compile(r"b")
+        p1_new = re.compile(r"a")
+
+        cache.put("a", 0, "test", p1)
+        cache.put("b", 0, "test", p2)
+        cache.put("a", 0, "test", p1_new)
+
+        assert cache.size() == 2
+        assert cache.get("a", 0, "test") is p1_new
+
+        # "a" was refreshed by the put, so "b" is evicted next
+        cache.put("c", 0, "test", re.compile(r"c"))
+        assert cache.get("b", 0, "test") is None
+        assert cache.get("a", 0, "test") is p1_new
+
+    def test_cache_ignores_implied_unicode_flag(self):
+        """Test that re.UNICODE does not split entries for str patterns."""
+        cache = PatternCache(maxsize=10)
+        compiled = re.compile(r"a")
+
+        cache.put("a", re.UNICODE, "test", compiled)
+        assert cache.get("a", 0, "test") is compiled
+        assert cache.get("a", re.IGNORECASE, "test") is None
+
+        cache.put("a", 0, "test", compiled)
+        assert cache.size() == 1
+
     def test_engine_uses_cache(self, engine):
         """Test that engine actually uses the cache."""
         pattern = r"\d+"
@@ -331,6 +374,16 @@ class TestMetrics:
         assert len(metrics.pattern_timings[pattern]) > 0
         assert metrics.pattern_timings[pattern][0] >= 0
 
+    def test_metrics_timing_history_is_bounded(self):
+        """Test that only the latest 100 timings are kept per pattern."""
+        metrics = RegexMetrics()
+        for i in range(150):
+            metrics.record_timed_operation("p", float(i))
+
+        assert metrics.total_operations == 150
+        assert len(metrics.pattern_timings["p"]) == 100
+        assert metrics.pattern_timings["p"][0] == 50.0
+
     def test_metrics_timeout_tracking(self):
         """Test timeout events are tracked."""
         # Use signal backend for timeout
@@ -393,85 +446,54 @@ class TestMetrics:
 class TestThreadSafety:
     """Test thread safety of regex engine."""
 
-    def test_concurrent_searches(self, engine):
+    def test_concurrent_searches(self, engine, pool):
         """Test multiple threads can search concurrently."""
-        results: list[str] = []
-        lock = threading.Lock()
 
-        def worker(pattern: str, text: str):
-            match = engine.search(pattern, text)
-            with lock:
-                results.append(match.group() if match else None)
+        def worker(i: int):
+            match = engine.search(r"\d+", f"test{i}number{i * 10}")
+            return match.group() if match else None
 
-        threads = [
-            threading.Thread(target=worker, args=(r"\d+", f"test{i}number{i * 10}"))
-            for i in range(20)
-        ]
-
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        results = list(pool.map(worker, range(20)))
 
         # All threads should complete successfully
         assert len(results) == 20
         assert all(r is not None and r.isdigit() for r in results)
 
-    def test_concurrent_substitutions(self, engine):
+    def test_concurrent_substitutions(self, engine, pool):
         """Test concurrent substitutions work correctly."""
-        results: list[str] = []
-        lock = threading.Lock()
 
-        def worker(pattern: str, text: str):
-            result = engine.sub(pattern, "X", text)
-            with lock:
-                results.append(result)
+        def worker(i: int):
+            return engine.sub(r"\d+", "X", f"test{i}")
 
-        threads = [
-            threading.Thread(target=worker, args=(r"\d+", f"test{i}"))
-            for i in range(20)
-        ]
-
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        results = list(pool.map(worker, range(20)))
 
         assert len(results) == 20
         assert all("X" in r for r in results)
 
-    def test_cache_thread_safety(self, engine):
+    def test_cache_thread_safety(self, engine, pool):
         """Test pattern cache is thread-safe."""
 
+        patterns = [f"pattern{i}" for i in range(3)]  # Use 3 different patterns
+        texts = [f"text{worker_id}" for worker_id in range(10)]
+
         def worker(worker_id: int):
             for i in range(10):
-                pattern = f"pattern{i % 3}"  # Use 3 different patterns
-                engine.search(pattern, f"text{worker_id}")
+                engine.search(patterns[i % 3], texts[worker_id])
 
-        threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
-
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        list(pool.map(worker, range(10)))
 
         # Should complete without crashes or deadlocks
         metrics = engine.get_metrics()
         assert metrics.total_operations > 0
 
-    def test_metrics_thread_safety(self, engine):
+    def test_metrics_thread_safety(self, engine, pool):
         """Test metrics tracking is thread-safe."""
 
-        def worker():
+        def worker(_: int):
             for _ in range(100):
                 engine.search(r"\d+", "test123")
 
-        threads = [threading.Thread(target=worker) for _ in range(5)]
-
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        list(pool.map(worker, range(5)))
 
         metrics = engine.get_metrics()
         # Should be exactly 500 operations
@@ -501,8 +523,6 @@ class TestBackendSelection:
         engine = RegexEngine(config)
 
         # Should fall back to signal backend on Unix, stdlib on Windows
-        import sys
-
         if sys.platform != "win32":
             assert isinstance(engine.backend, SignalBackend)
             assert engine.backend.supports_timeout
@@ -572,6 +592,69 @@ class TestPerformance:
         )
         print(f"Speedup: {time_no_cache / time_cached:.2f}x")
 
+    def test_untimed_calls_skip_backend(self, monkeypatch):
+        """Calls without timeouts or metrics run the pattern directly."""
+        engine = RegexEngine(
+            RegexConfig(
+                enable_metrics=False,
+                preferred_backend="stdlib",
+                search_timeout=0,
+                sub_timeout=0,
+                findall_timeout=0,
+            )
+        )
+        for operation in ("search", "match", "sub", "findall"):
+            monkeypatch.setattr(
+                engine.backend,
+                operation,
+                lambda *args, **kwargs: pytest.fail("backend was called"),
+            )
+
+        assert engine.search(r"\d+", "abc 123").group() == "123"
+        assert engine.match(r"[a-z]+", "abc 123").group() == "abc"
+        assert engine.sub(r"\d", "#", "a1b2", count=1) == "a#b2"
+        assert engine.findall(r"\d", "a1b2") == ["1", "2"]
+
+    def test_linear_pattern_detection(self):
+        """Only patterns with bounded backtracking count as linear."""
+        for pattern in (r"abc", r"[a-z]{2}-\d{4}", r"a{1,3}(b|c)", r"(?=x)y"):
+            assert is_linear_pattern(pattern), pattern
+        for pattern in (r"(a+)+b", r"(a*)*b", r"(a|a)*b", r"\s*x", r"a{0,99}b{0,99}"):
+            assert not is_linear_pattern(pattern), pattern
+        assert not is_linear_pattern(r"(")
+
+    def test_linear_pattern_detection_survives_parser_changes(self, monkeypatch):
+        """A failure inside the private parser analysis means "not linear"."""
+
+        def broken_parse(*args, **kwargs):
+            raise AttributeError("internal parser API changed")
+
+        monkeypatch.setattr(regex_engine.sre_parse, "parse", broken_parse)
+        is_linear_pattern.cache_clear()
+        try:
+            assert not is_linear_pattern(r"abc")
+        finally:
+            is_linear_pattern.cache_clear()
+
+    def test_linear_patterns_skip_timeout(self):
+        """Linear patterns run directly even when a timeout is requested."""
+        engine = RegexEngine(RegexConfig(enable_metrics=False))
+        backend_search = engine.backend.search
+        backend_patterns = []
+
+        def recording_search(compiled, string, timeout=None):
+            backend_patterns.append(compiled.pattern)
+            return backend_search(compiled, string, timeout)
+
+        engine.backend.search = recording_search
+
+        match = engine.search(r"\d{3}-\d{4}", "call 555-1234", timeout=0.5)
+        assert match.group() == "555-1234"
+        match = engine.search(r"\d+", "call 555", timeout=0.5)
+        assert match.group() == "555"
+
+        assert backend_patterns == [r"\d+"]
+
     @pytest.mark.skipif(not REGEX_AVAILABLE, reason="Requires regex module")
     def test_timeout_overhead(self):
         """Measure overhead of timeout protection on realistic workload."""
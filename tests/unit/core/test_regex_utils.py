@@ -3,16 +3,19 @@ Unit tests for regex utilities with timeout protection.
 """
 
 import re
+import signal
 import unittest
 from typing import Any
 from unittest.mock import patch
 
 from jsonshiatsu.core.regex_utils import (
     RegexTimeout,
+    _compile,
     safe_regex_findall,
     safe_regex_match,
     safe_regex_search,
     safe_regex_sub,
+    timeout_handler,
 )
 
 
@@ -110,21 +113,79 @@ class TestRegexUtils(unittest.TestCase):
         result = safe_regex_match(catastrophic_pattern, input_string, timeout=1)
         self.assertIsNone(result)
 
+    def test_precompiled_patterns(self) -> None:
+        """Test that precompiled patterns are accepted by all helpers."""
+        pattern = re.compile(r"\d+")
+
+        self.assertEqual(safe_regex_sub(pattern, "X", "abc123def456"), "abcXdefX")
+        self.assertEqual(safe_regex_findall(pattern, "a1b22"), ["1", "22"])
+
+        match = safe_regex_search(pattern, "abc123")
+        assert match is not None  # For type checker
+        self.assertEqual(match.group(), "123")
+
+        match = safe_regex_match(pattern, "123abc")
+        assert match is not None  # For type checker
+        self.assertEqual(match.group(), "123")
+
     def test_regex_timeout_exception(self) -> None:
         """Test RegexTimeout exception can be raised."""
         with self.assertRaises(RegexTimeout):
             raise RegexTimeout("Test timeout")
 
+    @patch("jsonshiatsu.core.regex_utils.signal.getsignal")
     @patch("jsonshiatsu.core.regex_utils.signal.signal")
     @patch("jsonshiatsu.core.regex_utils.signal.alarm")
-    def test_signal_handling(self, mock_alarm: Any, mock_signal: Any) -> None:
+    def test_signal_handling(
+        self, mock_alarm: Any, mock_signal: Any, mock_getsignal: Any
+    ) -> None:
         """Test that signal handling is properly set up and torn down."""
-        safe_regex_sub(r"test", "replacement", "test string")
+        mock_getsignal.return_value = signal.SIG_DFL
+        safe_regex_sub(r"te+st", "replacement", "test string")
 
         # Should set up signal handler and alarm
         self.assertEqual(mock_signal.call_count, 1)
         self.assertEqual(mock_alarm.call_count, 2)  # Set and clear alarm
 
+        # An installed handler is reused; only the alarm is armed and cleared
+        mock_getsignal.return_value = timeout_handler
+        safe_regex_sub(r"te+st", "replacement", "test string")
+        self.assertEqual(mock_signal.call_count, 1)
+        self.assertEqual(mock_alarm.call_count, 4)
+
+    @patch("jsonshiatsu.core.regex_utils.signal.alarm")
+    def test_operations_without_signals(self, mock_alarm: Any) -> None:
+        """Test that operations run unguarded where SIGALRM is unavailable."""
+        with patch("jsonshiatsu.core.regex_utils.SIGNALS_AVAILABLE", False):
+            self.assertEqual(safe_regex_sub(r"\d", "#", "a1"), "a#")
+            self.assertEqual(safe_regex_findall(r"\d", "a1b2"), ["1", "2"])
+        mock_alarm.assert_not_called()
+
+    @patch("jsonshiatsu.core.regex_utils._start_alarm")
+    def test_literal_patterns_skip_regex(self, mock_start_alarm: Any) -> None:
+        """Test that patterns without metacharacters use str methods."""
+        self.assertEqual(safe_regex_sub("ab", "x", "abcab"), "xcx")
+        self.assertEqual(safe_regex_findall("ab", "abcab"), ["ab", "ab"])
+        self.assertIsNone(safe_regex_search("xyz", "abc123def"))
+        self.assertIsNone(safe_regex_match("bc", "abc"))
+        mock_start_alarm.assert_not_called()
+
+        # Escapes in the replacement still go through the regex
+        self.assertEqual(safe_regex_sub("a", r"\n", "a"), "\n")
+        mock_start_alarm.assert_called_once()
+
+    def test_patterns_compiled_once(self) -> None:
+        """Test that repeated pattern strings reuse one compiled pattern."""
+        safe_regex_sub(r"cached\d+", "x", "cached1")
+        misses = _compile.cache_info().misses
+        self.assertEqual(safe_regex_sub(r"cached\d+", "x", "cached22"), "x")
+        self.assertEqual(safe_regex_findall(r"cached\d+", "cached3"), ["cached3"])
+        self.assertEqual(_compile.cache_info().misses, misses)
+
+        # A precompiled pattern with extra flags is still rejected
+        compiled = re.compile(r"a")
+        self.assertEqual(safe_regex_sub(compiled, "b", "aA", flags=re.I), "aA")
+
     def test_exception_handling_in_regex_operations(self) -> None:
         """Test that exceptions in regex operations are handled gracefully."""
         # Invalid regex pattern should be handled gracefully
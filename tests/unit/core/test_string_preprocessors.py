@@ -24,11 +24,28 @@ class TestStringPreprocessor(unittest.TestCase):
         result = StringPreprocessor.fix_unescaped_strings(input_text)
         self.assertEqual(result, input_text)  # Should remain unchanged
 
+    def test_fix_unescaped_strings_non_json_escapes(self) -> None:
+        """Test that strings mixing valid and invalid escapes are detected."""
+        # Invalid escape next to a valid one: only the invalid one is escaped
+        input_text = '{"p": "a\\qb\\nc"}'
+        expected = '{"p": "a\\\\qb\\nc"}'
+        self.assertEqual(StringPreprocessor.fix_unescaped_strings(input_text), expected)
+
+        # Only invalid escapes: treated as a path
+        input_text = '{"p": "a\\qb\\xc"}'
+        expected = '{"p": "a\\\\qb\\\\xc"}'
+        self.assertEqual(StringPreprocessor.fix_unescaped_strings(input_text), expected)
+
+        # Only valid escapes, including unicode: left alone
+        input_text = '{"p": "\\u0041\\n\\"x\\""}'
+        result = StringPreprocessor.fix_unescaped_strings(input_text)
+        self.assertEqual(result, input_text)
+
     def test_fix_unescaped_strings_no_backslashes(self) -> None:
         """Test that strings without backslashes are unchanged."""
         input_text = '{"message": "Hello world"}'
         result = StringPreprocessor.fix_unescaped_strings(input_text)
-        self.assertEqual(result, input_text)
+        self.assertIs(result, input_text)
 
     def test_fix_unescaped_quotes_basic(self) -> None:
         """Test fixing unescaped quotes in strings."""
@@ -108,11 +125,17 @@ class TestStringPreprocessor(unittest.TestCase):
     def test_handle_string_concatenation_multiple(self) -> None:
         """Test handling multiple string concatenations."""
         input_text = '"a" + "b" + "c"'
-        # After first iteration: "ab" + "c", then "abc"
+        # The whole chain is merged at once
         expected = '"abc"'
         result = StringPreprocessor.handle_string_concatenation(input_text)
         self.assertEqual(result, expected)
 
+        # Long chains and "+" inside string content
+        input_text = " + ".join(f'"{i}+"' for i in range(50))
+        expected = '"' + "".join(f"{i}+" for i in range(50)) + '"'
+        result = StringPreprocessor.handle_string_concatenation(input_text)
+        self.assertEqual(result, expected)
+
     def test_handle_string_concatenation_with_escaped_quotes(self) -> None:
         """Test concatenation with escaped quotes."""
         input_text = '"say \\"hello\\"" + " world"'
@@ -41,6 +41,20 @@ class TestTokenizerAccuracy(unittest.TestCase):
         tokens = self._get_non_eof_tokens('"quote: \\"test\\""')
         self.assertEqual(tokens[0].value, 'quote: "test"')
 
+    def test_unicode_escape_runs(self):
+        """Test consecutive unicode escapes, including surrogate pairs."""
+        tokens = self._get_non_eof_tokens('"\\u0041\\u00e9\\ud83d\\ude00!"')
+        self.assertEqual(tokens[0].value, "A\u00e9\U0001f600!")
+
+        # Lone surrogates become replacement characters
+        tokens = self._get_non_eof_tokens('"\\ud83d\\u0041\\ude00"')
+        self.assertEqual(tokens[0].value, "\ufffdA\ufffd")
+
+        # Incomplete escapes keep their text and do not skew positions
+        tokens = self._get_non_eof_tokens('"\\u12\\ud83d" x')
+        self.assertEqual(tokens[0].value, "u12\ufffd")
+        self.assertEqual(tokens[1].position.column, 14)
+
     def test_number_tokenization(self):
         """Test number tokenization accuracy."""
         test_cases = [
@@ -66,6 +80,11 @@ class TestTokenizerAccuracy(unittest.TestCase):
         tokens = self._get_non_eof_tokens("camelCase")
         self.assertEqual(tokens[0].value, "camelCase")
 
+        # Unicode escapes in identifiers; incomplete ones are kept as text
+        tokens = self._get_non_eof_tokens("caf\\u00e9 x\\u12y")
+        self.assertEqual([t.value for t in tokens], ["caf\u00e9", "xu12y"])
+        self.assertEqual(tokens[1].position.column, 11)
+
     def test_keyword_tokenization(self):
         """Test boolean and null keyword tokenization."""
         keywords = [
@@ -129,6 +148,16 @@ class TestTokenizerAccuracy(unittest.TestCase):
         has_newline = any(t.type == TokenType.NEWLINE for t in tokens)
         self.assertTrue(has_newline)
 
+    def test_positions_after_whitespace_and_string_runs(self):
+        """Test that positions stay accurate when runs are consumed in bulk."""
+        tokens = self._get_non_eof_tokens('  {"ab\\"c d":\t\t1,\n   "x\ny": 2}')
+        positions = [(t.value, t.position.line, t.position.column) for t in tokens]
+        self.assertEqual(positions[0], ("{", 1, 3))
+        self.assertEqual(positions[1], ('ab"c d', 1, 4))
+        self.assertEqual(positions[3], ("1", 1, 16))
+        self.assertEqual(positions[6], ("x\ny", 2, 4))
+        self.assertEqual(positions[8], ("2", 3, 5))
+
 
 if __name__ == "__main__":
     unittest.main()
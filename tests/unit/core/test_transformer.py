@@ -7,6 +7,7 @@ Tests focus on key preprocessing functionality that enables malformed JSON parsi
 import unittest
 
 from jsonshiatsu.core.string_preprocessors import StringPreprocessor
+from jsonshiatsu.core.transformer import JSONPreprocessor, _preprocess_cached
 from jsonshiatsu.preprocessing.extractors import ContentExtractor, MarkdownExtractor
 from jsonshiatsu.preprocessing.handlers import CommentHandler, JavaScriptHandler
 from jsonshiatsu.preprocessing.normalizers import QuoteNormalizer
@@ -51,6 +52,13 @@ class TestCriticalPreprocessing(unittest.TestCase):
         self.assertIn('"key"', result)
         self.assertIn('"value"', result)
 
+        # Text without a "/" is returned untouched
+        no_comments = "{'key': 'value # not a comment'}"
+        self.assertIs(handler.process(no_comments, PreprocessingConfig()), no_comments)
+        self.assertIs(
+            MarkdownExtractor().process(no_comments, PreprocessingConfig()), no_comments
+        )
+
     def test_quote_normalization(self) -> None:
         """Test normalization of various quote styles."""
         # Smart quotes to standard quotes
@@ -438,6 +446,41 @@ class TestFullPreprocessingPipeline(unittest.TestCase):
         # Aggressive should extract from markdown
         self.assertNotIn("```", result_aggressive)
 
+    def test_preprocess_memoizes_by_config(self) -> None:
+        """Test that JSONPreprocessor.preprocess caches per text and config."""
+        text = "{'key': True, other: [1,,2]}"
+        aggressive = JSONPreprocessor.preprocess(text, aggressive=True)
+        self.assertIs(JSONPreprocessor.preprocess(text, aggressive=True), aggressive)
+        self.assertEqual(
+            aggressive,
+            PreprocessingPipeline.create_default_pipeline().process(
+                text, PreprocessingConfig.aggressive()
+            ),
+        )
+
+        # A different config must not reuse the aggressive result
+        conservative = JSONPreprocessor.preprocess(text, aggressive=False)
+        self.assertEqual(
+            conservative,
+            PreprocessingPipeline.create_default_pipeline().process(
+                text, PreprocessingConfig.conservative()
+            ),
+        )
+        self.assertNotEqual(conservative, aggressive)
+
+    def test_preprocess_skips_cache_for_long_text(self) -> None:
+        """Test that long documents are not kept in the preprocess cache."""
+        text = "{'key': True, other: [1,,2]}" + " " * 600
+        entries = _preprocess_cached.cache_info().currsize
+        result = JSONPreprocessor.preprocess(text, aggressive=True)
+        self.assertEqual(_preprocess_cached.cache_info().currsize, entries)
+        self.assertEqual(
+            result,
+            PreprocessingPipeline.create_default_pipeline().process(
+                text, PreprocessingConfig.aggressive()
+            ),
+        )
+
     def test_preprocessing_idempotency(self) -> None:
         """Test that preprocessing is idempotent for valid JSON."""
         valid_json = '{"test": "value", "number": 123, "array": [1, 2, 3]}'
@@ -537,6 +580,29 @@ class TestPreprocessingEdgeCases(unittest.TestCase):
         self.assertNotIn("Comment", result)
         self.assertNotIn("Block", result)
 
+    def test_comment_removal_exact_output(self) -> None:
+        """Test comment removal around strings, escapes and unterminated comments."""
+        cases = {
+            '{"a": 1 // one\n}': '{"a": 1 \n}',
+            '{"a":/*x*/1}': '{"a": 1}',
+            '{"a": /*x*/ 1}': '{"a":  1}',
+            '{"u": "http://x", "e": "\\" // kept"}': (
+                '{"u": "http://x", "e": "\\" // kept"}'
+            ),
+            "['/*', 'a'] // done": "['/*', 'a'] ",
+            '"unterminated // kept': '"unterminated // kept',
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                result = CommentHandler().process(text, PreprocessingConfig())
+                self.assertEqual(result, expected)
+
+        # An unterminated block comment is removed; what is kept after it is
+        # not pinned here
+        result = CommentHandler().process('{"a": 1} /* open', PreprocessingConfig())
+        self.assertTrue(result.startswith('{"a": 1}'))
+        self.assertNotIn("/*", result)
+
     def test_unicode_in_preprocessing(self) -> None:
         """Test Unicode handling in preprocessing."""
         unicode_json = """{